@@ -17,7 +17,7 @@ async def check_if_setup_done(
         if isinstance(obj, commands.Context)
         else obj.client.get_cog("DonationLogger")
     )
-    return await cog.config.guild(obj.guild).setup() if obj.guild else False
+    return (await cog.get_guild_settings(obj.guild.id)).setup if obj.guild else False
 
 
 def is_setup_done():
@@ -37,7 +37,7 @@ async def check_if_is_a_dono_manager_or_higher(
         author = obj.user
         bot = obj.client
     cog: "DonationLogger" = bot.get_cog("DonationLogger")
-    managers = await cog.config.guild(obj.guild).managers()
+    managers = (await cog.get_guild_settings(obj.guild.id)).managers
     return (
         await bot.is_owner(author)
         or author.guild_permissions.manage_guild
@@ -1,3 +1,4 @@
+import datetime as dt
 import discord
 import re
 
@@ -56,13 +57,41 @@ class AmountConverter(app_commands.Transformer):
                 "You need to be a donationlogger manager or higher to run this command.",
                 True,
             ]
-        context = interaction.client.get_context(interaction)
+        context = await interaction.client.get_context(interaction)
         try:
             return await cls.convert(context, value)
         except AmountConversionFailure as e:
             return [str(e), False]
 
 
+class DateConverter(app_commands.Transformer):
+    @classmethod
+    async def convert(cls, ctx: commands.Context, argument: str) -> dt.datetime:
+        try:
+            return dt.datetime.strptime(argument.strip(), "%Y-%m-%d").replace(
+                tzinfo=dt.timezone.utc
+            )
+        except ValueError as e:
+            raise commands.BadArgument(
+                f'Failed to convert "{argument}" into a date, use the `YYYY-MM-DD` format.'
+            ) from e
+
+    @classmethod
+    async def transform(
+        cls, interaction: discord.Interaction[Red], value: str
+    ) -> dt.datetime:
+        context = await interaction.client.get_context(interaction)
+        try:
+            return await cls.convert(context, value)
+        except commands.BadArgument as e:
+            return [str(e), True]
+
+
+class LeaderboardFlags(commands.FlagConverter, prefix="--", delimiter=" "):
+    since: DateConverter = commands.flag(default=None)
+    until: DateConverter = commands.flag(default=None)
+
+
 class DLEmojiConverter(NoobEmojiConverter):
     async def convert(self, ctx: commands.Context, argument: str):
         argument = argument.strip()
@@ -96,8 +125,8 @@ class BankConverter(app_commands.Transformer):
     @classmethod
     async def convert(cls, ctx: commands.Context, argument: str) -> str:
         cog: "DonationLogger" = ctx.bot.get_cog("DonationLogger")
-        banks = await cog.config.guild(ctx.guild).banks()
-        if not banks.get(argument.strip().lower()):
+        banks = (await cog.get_guild_settings(ctx.guild.id)).banks
+        if argument.strip().lower() not in banks:
             raise BankConversionFailure(f'Bank "{argument}" does not exist.')
         return argument.strip().lower()
 
@@ -125,12 +154,10 @@ class BankConverter(app_commands.Transformer):
         self, interaction: discord.Interaction[Red], value: int | float | str
     ) -> List[app_commands.Choice[str | int | float]]:
         cog: "DonationLogger" = interaction.client.get_cog("DonationLogger")
-        banks = await cog.config.guild(interaction.guild).banks()
-        bank_list: List[str] = [
-            bank for bank, bank_info in banks.items() if not bank_info["hidden"]
-        ]
+        if not interaction.guild:
+            return []
+        settings = await cog.get_guild_settings(interaction.guild.id)
         return [
             app_commands.Choice(name=choice.title(), value=choice)
-            for choice in bank_list
-            if value.lower() in choice.lower()
+            for choice in settings.complete(str(value))
         ]
@@ -1,22 +1,56 @@
+import asyncio
+import datetime as dt
 import discord
 import noobutils as nu
+import tempfile
+import time
 
+from discord.ext import tasks
+from redbot.core import config
 from redbot.core.bot import app_commands, commands, Red
 from redbot.core.utils import chat_formatting as cf, mod
 
-from typing import Dict, Literal, List, Optional, Union
+from typing import (
+    Coroutine,
+    Dict,
+    Iterable,
+    Literal,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
-from .checks import is_a_dono_manager_or_higher, is_setup_done
+from .checks import (
+    check_if_setup_done,
+    is_a_dono_manager_or_higher,
+    is_setup_done,
+)
 from .converters import (
     AmountConverter,
     BankConverter,
+    DateConverter,
     DLEmojiConverter,
+    LeaderboardFlags,
     MemberOrUserConverter,
 )
 from .exceptions import MoreThanThreeRoles
 from .hybrids import HYBRIDS
-from .utilities import verify_amount_roles
-
+from .locks import KeyedLocks
+from .utilities import (
+    AmountRoleTable,
+    BalanceSnapshot,
+    DonorIndex,
+    DonorPageSource,
+    DonorTotals,
+    GuildSettings,
+    LedgerPartition,
+    ReconcileProgress,
+    parse_donor_table,
+    verify_amount_roles,
+    write_donor_table,
+)
 
 DEFAULT_GUILD = {
     "managers": [],
@@ -25,6 +59,7 @@ DEFAULT_GUILD = {
     "auto_role": False,
     "setup": False,
 }
+DEFAULT_GLOBAL = {"donors_migrated": False}
 
 
 class DonationLogger(nu.Cog):
@@ -34,6 +69,14 @@ class DonationLogger(nu.Cog):
     Log any donations from your server.
     """
 
+    BATCH_LIMIT = 200
+    IMPORT_SIZE_LIMIT = 1024 * 1024
+    BULK_WRITE_THRESHOLD = 25
+    LEDGER_RANGE_LIMIT = 366
+    BALANCE_SNAPSHOT_LIMIT = 10000
+    RECONCILE_CHUNK = 500
+    RECONCILE_EDIT_DELAY = 1.5
+
     def __init__(self, bot: Red, *args, **kwargs) -> None:
         super().__init__(
             bot=bot,
@@ -47,7 +90,28 @@ class DonationLogger(nu.Cog):
             **kwargs,
         )
         self.config.register_guild(**DEFAULT_GUILD)
+        self.config.register_global(**DEFAULT_GLOBAL)
+        self.config.register_user(ledger=[])
+        self.config.init_custom("DONORS", 3)
+        self.config.register_custom("DONORS", donations=0)
+        self.config.init_custom("LEDGER", 3)
+        self.config.register_custom("LEDGER", entries=[])
         self.setupcache = []
+        self.side_effect_queues: Dict[int, asyncio.Queue[Coroutine]] = {}
+        self.side_effect_tasks: Dict[int, asyncio.Task] = {}
+        self.donor_index: Dict[Tuple[int, str], DonorIndex] = {}
+        self.donor_totals: Dict[int, DonorTotals] = {}
+        self.amount_role_tables: Dict[Tuple[int, str], AmountRoleTable] = {}
+        self.guild_settings: Dict[int, GuildSettings] = {}
+        self.ledger_cache: Dict[Tuple[int, str, str], LedgerPartition] = {}
+        self.member_banks: Dict[int, Set[Tuple[int, str]]] = {}
+        self.member_banks_built = False
+        self.ledger_indexed: Dict[Tuple[int, int, str], str] = {}
+        self.donor_locks = KeyedLocks()
+        self.balance_versions: Dict[int, int] = {}
+        self.balance_snapshots: Dict[Tuple[int, int], BalanceSnapshot] = {}
+        self.reconcile_progress: Dict[int, ReconcileProgress] = {}
+        self.reconcile_tasks: Dict[int, asyncio.Task] = {}
 
     async def red_delete_data_for_user(
         self,
@@ -60,58 +124,723 @@ class DonationLogger(nu.Cog):
 
         Users can remove their data at anytime.
         """
-        for g in (await self.config.all_guilds()).keys():
-            async with self.config.guild_from_id(g).banks() as banks:
-                for bank in banks.values():
-                    try:
-                        del bank["donators"][str(user_id)]
-                    except KeyError:
-                        continue
+        if not self.member_banks_built:
+            await self.build_member_banks()
+        for guild_id, bank_name in self.member_banks.get(user_id, set()).copy():
+            async with self.member_lock(guild_id, bank_name, user_id):
+                await self.set_member_donations(guild_id, bank_name, user_id, 0)
+        self.member_banks.pop(user_id, None)
+
+        async with self.donor_locks.hold((user_id,)):
+            partitions = await self.config.user_from_id(user_id).ledger()
+            await self.config.user_from_id(user_id).clear()
+            for key in [k for k in self.ledger_indexed if k[0] == user_id]:
+                del self.ledger_indexed[key]
+        for guild_id, bank_name, day in partitions:
+            async with self.ledger_lock(guild_id, bank_name, day):
+                group = self.config.custom("LEDGER", str(guild_id), bank_name, day)
+                entries = [
+                    [*r[:3], 0] if r[3] == user_id else r
+                    for r in await group.entries()
+                    if r[1] != user_id
+                ]
+                if entries:
+                    await group.entries.set(entries)
+                    self.ledger_cache[(guild_id, bank_name, day)] = LedgerPartition(
+                        entries
+                    )
+                else:
+                    await group.clear()
+                    self.ledger_cache.pop((guild_id, bank_name, day), None)
+
+    async def cog_load(self):
+        if not await self.config.donors_migrated():
+            await self.migrate_donors()
+        self.reconcile_loop.start()
+
+    async def cog_unload(self):
+        self.reconcile_loop.cancel()
+        for task in self.reconcile_tasks.values():
+            task.cancel()
+        for task in self.side_effect_tasks.values():
+            task.cancel()
+        for queue in self.side_effect_queues.values():
+            while not queue.empty():
+                queue.get_nowait().close()
+
+    def queue_side_effect(self, guild_id: int, coro: Coroutine):
+        """
+        Run role updates and messages for a committed donation without holding any lock.
+
+        Each guild gets its own runner so side effects stay in order per guild.
+        """
+        queue = self.side_effect_queues.setdefault(guild_id, asyncio.Queue())
+        queue.put_nowait(coro)
+        task = self.side_effect_tasks.get(guild_id)
+        if task is None or task.done():
+            self.side_effect_tasks[guild_id] = asyncio.create_task(
+                self.side_effect_runner(guild_id)
+            )
 
-    async def get_dc_from_bank(
-        self, context: commands.Context, bank_name: str
-    ) -> List[discord.Embed]:
-        banks = await self.config.guild(context.guild).banks()
-        bank_info = banks.get(bank_name)
+    async def side_effect_runner(self, guild_id: int):
+        queue = self.side_effect_queues[guild_id]
+        while not queue.empty():
+            coro = queue.get_nowait()
+            try:
+                await coro
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.log.exception("Error running donation side effects: ", exc_info=e)
+            finally:
+                queue.task_done()
+
+    @tasks.loop(hours=12)
+    async def reconcile_loop(self):
+        if self.reconcile_loop.current_loop == 0:
+            # Don't sync every guild each time the cog is loaded.
+            return
+        for guild_id in await self.config.all_guilds():
+            if not (guild := self.bot.get_guild(guild_id)):
+                continue
+            settings = await self.get_guild_settings(guild_id)
+            if settings.setup and settings.auto_role:
+                # Guilds run side by side, one still running from last time is left alone.
+                self.start_reconcile(guild)
 
-        if not bank_info or bank_info["hidden"]:
-            return []
+    @reconcile_loop.before_loop
+    async def reconcile_before_loop(self):
+        await self.bot.wait_until_red_ready()
+
+    def start_reconcile(self, guild: discord.Guild) -> asyncio.Task:
+        """
+        Start reconciling a guild's donation roles unless it is already running.
+        """
+        task = self.reconcile_tasks.get(guild.id)
+        if task is None or task.done():
+            task = asyncio.create_task(self.reconcile_guild(guild))
+            self.reconcile_tasks[guild.id] = task
+        return task
+
+    async def reconcile_guild(self, guild: discord.Guild) -> ReconcileProgress:
+        """
+        Bring every member's donation roles in line with their balances.
+
+        Donors are streamed from each bank's index against its threshold table in chunks,
+        members whose roles differ are queued and edited one at a time with a delay.
+        """
+        progress = ReconcileProgress(round(time.time()))
+        self.reconcile_progress[guild.id] = progress
+        try:
+            banks = list((await self.get_guild_settings(guild.id)).banks)
+            managed = set()
+            for bank_name in banks:
+                managed |= (
+                    await self.get_amount_role_table(guild.id, bank_name)
+                ).managed
+            editable = {
+                r
+                for r in managed
+                if (role := guild.get_role(r))
+                and role < guild.me.top_role
+                and not role.managed
+            }
+            if not editable or not guild.me.guild_permissions.manage_roles:
+                progress.status = "Nothing to reconcile"
+                return progress
+
+            async def earned(member_id: int) -> Set[int]:
+                roles = set()
+                for bank_name in banks:
+                    table = await self.get_amount_role_table(guild.id, bank_name)
+                    index = await self.get_donor_index(guild.id, bank_name)
+                    roles |= table.earned(index.donations.get(member_id, 0))
+                return roles & editable
+
+            queue: Dict[int, None] = {}
+            streams = []
+            for bank_name in banks:
+                table = await self.get_amount_role_table(guild.id, bank_name)
+                index = await self.get_donor_index(guild.id, bank_name)
+                if table.thresholds:
+                    stop = index.count_at_least(table.thresholds[0])
+                    streams.append((table, index.order[:stop]))
+            progress.total = sum(len(donors) for _, donors in streams)
+            for table, donors in streams:
+                for amount, member_id in donors:
+                    progress.scanned += 1
+                    if progress.scanned % self.RECONCILE_CHUNK == 0:
+                        await asyncio.sleep(0)
+                    member = guild.get_member(member_id)
+                    if member and (table.earned(-amount) & editable).difference(
+                        member._roles
+                    ):
+                        queue[member_id] = None
+            for role_id in editable:
+                for member in guild.get_role(role_id).members:
+                    queue[member.id] = None
+
+            progress.status = "Editing roles"
+            progress.pending = len(queue)
+            reason = "Reconciled donation roles with the member's donation balance."
+            for member_id in queue:
+                if not (await self.get_guild_settings(guild.id)).auto_role:
+                    progress.status = "Stopped, autorole was disabled"
+                    return progress
+                progress.pending -= 1
+                if not (member := guild.get_member(member_id)):
+                    continue
+                have = editable.intersection(member._roles)
+                want = await earned(member_id)
+                add, remove = want - have, have - want
+                if not add and not remove:
+                    continue
+                try:
+                    if add:
+                        await member.add_roles(
+                            *[discord.Object(r) for r in add], reason=reason
+                        )
+                    if remove:
+                        await member.remove_roles(
+                            *[discord.Object(r) for r in remove], reason=reason
+                        )
+                    progress.added += len(add)
+                    progress.removed += len(remove)
+                    progress.edited += 1
+                except discord.HTTPException:
+                    progress.failed += 1
+                await asyncio.sleep(self.RECONCILE_EDIT_DELAY)
+            progress.status = "Done"
+            if progress.edited or progress.failed:
+                self.log.info(
+                    f"Reconciled donation roles in {guild.id}: {progress.added} added, "
+                    f"{progress.removed} removed, {progress.failed} failed edits."
+                )
+            return progress
+        except Exception as e:
+            progress.status = "Failed"
+            self.log.exception(
+                f"Error reconciling donation roles in {guild.id}: ", exc_info=e
+            )
+            return progress
+        finally:
+            progress.finished = round(time.time())
+
+    async def migrate_donors(self):
+        """
+        Move donors out of the guild `banks` value into the `DONORS` custom group.
+        """
+        for guild_id, guild_data in (await self.config.all_guilds()).items():
+            if not any("donators" in b for b in guild_data.get("banks", {}).values()):
+                continue
+            async with self.config.guild_from_id(guild_id).banks() as banks:
+                for bank_name, bank in banks.items():
+                    donators = bank.pop("donators", {})
+                    await self.donor_group(guild_id, bank_name).set(
+                        {k: {"donations": v} for k, v in donators.items() if v > 0}
+                    )
+            self.drop_guild_settings(guild_id)
+        await self.config.donors_migrated.set(True)
+        self.log.info("DonationLogger donors migrated to per bank storage.")
+
+    async def build_member_banks(self):
+        """
+        Index which guild banks hold balances of each member.
+
+        Built on the first data deletion request, balance writes keep it up to date after.
+        """
+        for guild_id, banks in (await self.config.custom("DONORS").all()).items():
+            for bank_name, donors in banks.items():
+                for member_id in donors:
+                    self.member_banks.setdefault(int(member_id), set()).add(
+                        (int(guild_id), bank_name)
+                    )
+        self.member_banks_built = True
+
+    def drop_member_banks(self, guild_id: int, bank_name: str = None):
+        for member_id, banks in list(self.member_banks.items()):
+            banks.difference_update(
+                [
+                    k
+                    for k in banks
+                    if k[0] == guild_id
+                    and (bank_name is None or k[1] == bank_name.lower())
+                ]
+            )
+            if not banks:
+                del self.member_banks[member_id]
 
-        sorted_donators = sorted(
-            bank_info["donators"].items(), key=lambda x: x[1], reverse=True
+    def member_lock(self, guild_id: int, bank_name: str, *member_ids: int):
+        """
+        Lock members' balances of a bank, other members of the bank stay unlocked.
+        """
+        return self.donor_locks.hold(
+            *[(guild_id, bank_name.lower(), member_id) for member_id in member_ids],
+            shared=[(guild_id, bank_name.lower())],
         )
 
-        final = []
-        for index, (k, v) in enumerate(sorted_donators, 1):
-            member = context.guild.get_member(int(k))
-            e = "➡️ " if member == context.author else ""
-            final.append(
-                f"{e}{index}. {member.mention} (`{member.id}`): **{cf.humanize_number(v)}**\n"
-                if member
-                else f"{index}. [Member not found in guild] (`{k}`): **{cf.humanize_number(v)}**\n"
+    def bank_lock(self, guild_id: int, *bank_names: str):
+        """
+        Lock whole banks for writes that replace every donor at once.
+        """
+        return self.donor_locks.hold(*[(guild_id, b.lower()) for b in bank_names])
+
+    def donor_group(
+        self, guild_id: int, bank_name: str = None, member_id: int = None
+    ) -> config.Group:
+        identifiers = [str(guild_id)]
+        if bank_name is not None:
+            identifiers.append(bank_name.lower())
+        if member_id is not None:
+            identifiers.append(str(member_id))
+        return self.config.custom("DONORS", *identifiers)
+
+    async def get_bank_donors(self, guild_id: int, bank_name: str) -> Dict[int, int]:
+        donors = await self.donor_group(guild_id, bank_name).all()
+        return {int(k): v["donations"] for k, v in donors.items() if v.get("donations")}
+
+    async def get_member_donations(
+        self, guild_id: int, member_id: int, bank_names: Iterable[str]
+    ) -> Dict[str, int]:
+        return {
+            bank_name: (await self.get_donor_index(guild_id, bank_name)).donations.get(
+                member_id, 0
+            )
+            for bank_name in bank_names
+        }
+
+    async def get_member_balance(
+        self, guild_id: int, member_id: int
+    ) -> BalanceSnapshot:
+        """
+        A member's visible bank balances and overall total without taking any lock.
+
+        Snapshots are cached until the member's balance or the guild's banks change.
+        """
+        key = (guild_id, member_id)
+        while (snapshot := self.balance_snapshots.get(key)) is None:
+            version = self.balance_versions.get(guild_id, 0)
+            settings = await self.get_guild_settings(guild_id)
+            indexes = [
+                await self.get_donor_index(guild_id, b) for b in settings.visible
+            ]
+            totals = await self.get_donor_totals(guild_id)
+            if version != self.balance_versions.get(guild_id, 0):
+                # Something was written while the indexes loaded, read them again.
+                continue
+            snapshot = BalanceSnapshot(
+                version,
+                tuple(
+                    (b, settings.banks[b]["emoji"], index.donations.get(member_id, 0))
+                    for b, index in zip(settings.visible, indexes)
+                ),
+                totals.donations.get(member_id, 0),
+            )
+            if len(self.balance_snapshots) >= self.BALANCE_SNAPSHOT_LIMIT:
+                self.balance_snapshots.clear()
+            self.balance_snapshots[key] = snapshot
+        return snapshot
+
+    def drop_balances(self, guild_id: int, member_ids: Iterable[int] = None):
+        """
+        Bump a guild's balance version and drop the affected snapshots.
+        """
+        self.balance_versions[guild_id] = self.balance_versions.get(guild_id, 0) + 1
+        if member_ids is not None:
+            for member_id in member_ids:
+                self.balance_snapshots.pop((guild_id, member_id), None)
+            return
+        for key in [k for k in self.balance_snapshots if k[0] == guild_id]:
+            del self.balance_snapshots[key]
+
+    async def get_donor_totals(self, guild_id: int) -> DonorTotals:
+        if (totals := self.donor_totals.get(guild_id)) is None:
+            visible = (await self.get_guild_settings(guild_id)).visible
+            combined: Dict[int, int] = {}
+            for bank_name in visible:
+                for member_id, amount in await self.get_donor_index(
+                    guild_id, bank_name
+                ):
+                    combined[member_id] = combined.get(member_id, 0) + amount
+            totals = self.donor_totals.setdefault(
+                guild_id, DonorTotals(visible, combined)
+            )
+        return totals
+
+    async def get_donor_index(self, guild_id: int, bank_name: str) -> DonorIndex:
+        key = (guild_id, bank_name.lower())
+        if (index := self.donor_index.get(key)) is None:
+            index = DonorIndex(await self.get_bank_donors(guild_id, bank_name))
+            # A concurrent load may have cached and updated an index meanwhile.
+            index = self.donor_index.setdefault(key, index)
+        return index
+
+    async def get_amount_role_table(
+        self, guild_id: int, bank_name: str
+    ) -> AmountRoleTable:
+        key = (guild_id, bank_name.lower())
+        if (table := self.amount_role_tables.get(key)) is None:
+            banks = (await self.get_guild_settings(guild_id)).banks
+            table = AmountRoleTable(banks.get(bank_name.lower(), {}).get("roles", {}))
+            self.amount_role_tables[key] = table
+        return table
+
+    async def get_guild_settings(self, guild_id: int) -> GuildSettings:
+        if (settings := self.guild_settings.get(guild_id)) is None:
+            settings = GuildSettings(await self.config.guild_from_id(guild_id).all())
+            self.guild_settings[guild_id] = settings
+        return settings
+
+    def drop_guild_settings(self, guild_id: int = None):
+        if guild_id is None:
+            self.guild_settings.clear()
+            self.balance_snapshots.clear()
+        else:
+            self.guild_settings.pop(guild_id, None)
+            self.drop_balances(guild_id)
+
+    def drop_donor_index(self, guild_id: int, bank_name: str = None):
+        for key in [
+            k
+            for k in self.donor_index
+            if k[0] == guild_id and (bank_name is None or k[1] == bank_name.lower())
+        ]:
+            del self.donor_index[key]
+        for key in [
+            k
+            for k in self.amount_role_tables
+            if k[0] == guild_id and (bank_name is None or k[1] == bank_name.lower())
+        ]:
+            del self.amount_role_tables[key]
+        self.donor_totals.pop(guild_id, None)
+        self.drop_balances(guild_id)
+
+    async def set_member_donations(
+        self,
+        guild_id: int,
+        bank_name: str,
+        member_id: int,
+        amount: int,
+        actor_id: int = 0,
+    ):
+        previous = await self.write_member_donations(
+            guild_id, bank_name, member_id, amount
+        )
+        self.drop_balances(guild_id, [member_id])
+        await self.log_ledger(
+            guild_id, bank_name, actor_id, {member_id: max(amount, 0) - previous}
+        )
+
+    async def write_member_donations(
+        self, guild_id: int, bank_name: str, member_id: int, amount: int
+    ) -> int:
+        """
+        Write one member's group and update the cached indexes, returns the previous balance.
+
+        Callers hold the member's lock and take care of balances and the ledger.
+        """
+        index = await self.get_donor_index(guild_id, bank_name)
+        group = self.donor_group(guild_id, bank_name, member_id)
+        if amount > 0:
+            await group.donations.set(amount)
+        else:
+            await group.clear()
+        previous = index.donations.get(member_id, 0)
+        index.set(member_id, max(amount, 0))
+        if totals := self.donor_totals.get(guild_id):
+            totals.add(bank_name.lower(), member_id, max(amount, 0) - previous)
+        return previous
+
+    @staticmethod
+    def ledger_days(since: dt.datetime, until: dt.datetime) -> List[str]:
+        days = []
+        day = since.date()
+        while day <= until.date():
+            days.append(day.isoformat())
+            day += dt.timedelta(days=1)
+        return days
+
+    def ledger_lock(self, guild_id: int, bank_name: str, day: str):
+        """
+        Lock one day of a bank's ledger so appends and rewrites never interleave.
+        """
+        return self.donor_locks.hold((guild_id, bank_name.lower(), day))
+
+    async def get_ledger_partition(
+        self, guild_id: int, bank_name: str, day: str
+    ) -> LedgerPartition:
+        """
+        One day of a bank's ledger, empty days are read again instead of being cached.
+        """
+        key = (guild_id, bank_name.lower(), day)
+        if (partition := self.ledger_cache.get(key)) is None:
+            entries = await self.config.custom(
+                "LEDGER", str(guild_id), bank_name.lower(), day
+            ).entries()
+            partition = LedgerPartition(entries)
+            if entries:
+                partition = self.ledger_cache.setdefault(key, partition)
+        return partition
+
+    async def log_ledger(
+        self, guild_id: int, bank_name: str, actor_id: int, deltas: Dict[int, int]
+    ):
+        """
+        Append `{member_id: delta}` balance changes to today's ledger partition.
+        """
+        deltas = {k: v for k, v in deltas.items() if v}
+        if not deltas:
+            return
+        now = dt.datetime.now(dt.timezone.utc)
+        day = now.date().isoformat()
+        records = [[round(now.timestamp()), k, v, actor_id] for k, v in deltas.items()]
+        async with self.ledger_lock(guild_id, bank_name, day):
+            partition = await self.get_ledger_partition(guild_id, bank_name, day)
+            for record in records:
+                partition.append(record)
+                self.member_banks.setdefault(record[1], set()).add(
+                    (guild_id, bank_name.lower())
+                )
+            async with self.config.custom(
+                "LEDGER", str(guild_id), bank_name.lower(), day
+            ).entries() as entries:
+                entries.extend(records)
+            await self.index_ledger_users(
+                guild_id, bank_name, day, {*deltas, actor_id} - {0}
+            )
+
+    async def index_ledger_users(
+        self, guild_id: int, bank_name: str, day: str, user_ids: Set[int]
+    ):
+        """
+        Add a ledger partition to the persisted partitions of each user in it.
+        """
+        user_ids = {
+            u
+            for u in user_ids
+            if self.ledger_indexed.get((u, guild_id, bank_name.lower())) != day
+        }
+        if not user_ids:
+            return
+        async with self.donor_locks.hold(*[(u,) for u in user_ids]):
+            for user_id in user_ids:
+                entry = [guild_id, bank_name.lower(), day]
+                async with self.config.user_from_id(user_id).ledger() as ledger:
+                    if entry not in ledger:
+                        ledger.append(entry)
+                self.ledger_indexed[(user_id, guild_id, bank_name.lower())] = day
+
+    async def get_ledger_totals(
+        self, guild_id: int, bank_name: str, since: dt.datetime, until: dt.datetime
+    ) -> DonorIndex:
+        """
+        Net donations per member of a bank between two dates, ordered like a donor index.
+        """
+        combined: Dict[int, int] = {}
+        for day in self.ledger_days(since, until):
+            partition = await self.get_ledger_partition(guild_id, bank_name, day)
+            for member_id, delta in partition.totals(
+                round(since.timestamp()), round(until.timestamp())
+            ).items():
+                combined[member_id] = combined.get(member_id, 0) + delta
+        return DonorIndex({k: v for k, v in combined.items() if v > 0})
+
+    async def clear_ledger(self, guild_id: int, bank_name: str = None):
+        """
+        Clear the ledger of a guild or one of its banks, called whenever its donors are cleared.
+        """
+        self.drop_member_banks(guild_id, bank_name)
+        for key in [
+            k
+            for k in self.ledger_cache
+            if k[0] == guild_id and (bank_name is None or k[1] == bank_name.lower())
+        ]:
+            del self.ledger_cache[key]
+        if bank_name is None:
+            await self.config.custom("LEDGER", str(guild_id)).clear()
+        else:
+            await self.config.custom("LEDGER", str(guild_id), bank_name.lower()).clear()
+
+    async def bank_credit_many(
+        self,
+        guild: discord.Guild,
+        bank_name: str,
+        amounts: Dict[int, int],
+        apply_multi: bool = True,
+        actor_id: int = 0,
+    ) -> Dict[int, Tuple[int, int]]:
+        """
+        Add donations to many members of a bank without any messages or role updates.
+
+        Callers apply milestone roles from the returned balances with
+        `add_dono_roles_many` or `update_dono_roles`, both honour the auto role setting.
+
+        Negative amounts debit the member, balances never drop below 0.
+        Small batches only lock and write the members involved, larger ones
+        rewrite the bank once under the bank lock.
+        Returns a `{member_id: (previous, updated)}` mapping.
+        """
+        results: Dict[int, Tuple[int, int]] = {}
+        bank = (await self.get_guild_settings(guild.id)).banks.get(bank_name.lower())
+        if not bank:
+            return results
+        multi = (bank.get("multi") or 1) if apply_multi else 1
+        if len(amounts) <= self.BULK_WRITE_THRESHOLD:
+            async with self.member_lock(guild.id, bank_name, *amounts):
+                index = await self.get_donor_index(guild.id, bank_name)
+                for member_id, amount in amounts.items():
+                    if amount > 0:
+                        amount = round(amount * multi)
+                    updated = max(index.donations.get(member_id, 0) + amount, 0)
+                    previous = await self.write_member_donations(
+                        guild.id, bank_name, member_id, updated
+                    )
+                    results[member_id] = (previous, updated)
+                self.drop_balances(guild.id, results)
+                await self.log_ledger(
+                    guild.id,
+                    bank_name,
+                    actor_id,
+                    {
+                        k: updated - previous
+                        for k, (previous, updated) in results.items()
+                    },
+                )
+            return results
+        async with self.bank_lock(guild.id, bank_name):
+            async with self.donor_group(guild.id, bank_name).all() as donors:
+                for member_id, amount in amounts.items():
+                    if amount > 0:
+                        amount = round(amount * multi)
+                    previous = donors.get(str(member_id), {}).get("donations", 0)
+                    updated = max(previous + amount, 0)
+                    if updated:
+                        donors[str(member_id)] = {"donations": updated}
+                    else:
+                        donors.pop(str(member_id), None)
+                    results[member_id] = (previous, updated)
+            if index := self.donor_index.get((guild.id, bank_name.lower())):
+                for member_id, (_, updated) in results.items():
+                    index.set(member_id, updated)
+            if totals := self.donor_totals.get(guild.id):
+                for member_id, (previous, updated) in results.items():
+                    totals.add(bank_name.lower(), member_id, updated - previous)
+            self.drop_balances(guild.id, results)
+            await self.log_ledger(
+                guild.id,
+                bank_name,
+                actor_id,
+                {k: updated - previous for k, (previous, updated) in results.items()},
+            )
+        return results
+
+    async def import_bank_donors(
+        self,
+        guild_id: int,
+        bank_name: str,
+        balances: Dict[int, int],
+        replace: bool,
+        actor_id: int = 0,
+    ) -> Dict[int, int]:
+        """
+        Set many donor balances of a bank in one write.
+
+        With `replace` every donor not in `balances` is cleared. Returns the new donors.
+        """
+        async with self.bank_lock(guild_id, bank_name):
+            index = await self.get_donor_index(guild_id, bank_name)
+            donors = {} if replace else dict(index.donations)
+            donors.update(balances)
+            donors = {k: v for k, v in donors.items() if v > 0}
+            await self.donor_group(guild_id, bank_name).set(
+                {str(k): {"donations": v} for k, v in donors.items()}
+            )
+            self.donor_index[(guild_id, bank_name.lower())] = DonorIndex(donors)
+            self.donor_totals.pop(guild_id, None)
+            self.drop_balances(guild_id)
+            await self.log_ledger(
+                guild_id,
+                bank_name,
+                actor_id,
+                {
+                    k: donors.get(k, 0) - index.donations.get(k, 0)
+                    for k in set(donors) | set(index.donations)
+                },
             )
+        return donors
 
-        return await nu.pagify_this(
-            "\n".join(final),
-            "\n",
-            "".join([f"{context.guild.name}", " | Page ({index}/{pages})"]),
-            embed_title=f"All of the donors for [{bank_name.title()}]",
-            embed_colour=await context.embed_colour(),
-            footer_icon=nu.is_have_avatar(context.guild),
+    async def bank_credit(
+        self,
+        guild: discord.Guild,
+        bank_name: str,
+        member_id: int,
+        amount: int,
+        apply_multi: bool = True,
+        actor_id: int = 0,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Add donations to a member of a bank without any messages or role updates.
+
+        Returns `(previous, updated)` for `update_dono_roles`, or None if the bank is gone.
+        """
+        results = await self.bank_credit_many(
+            guild, bank_name, {member_id: amount}, apply_multi, actor_id
+        )
+        return results.get(member_id)
+
+    async def bank_debit(
+        self,
+        guild: discord.Guild,
+        bank_name: str,
+        member_id: int,
+        amount: int,
+        actor_id: int = 0,
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Remove donations from a member of a bank without any messages or role updates.
+        """
+        return await self.bank_credit(
+            guild, bank_name, member_id, -amount, False, actor_id
         )
 
+    async def get_dc_from_bank(
+        self,
+        guild: discord.Guild,
+        bank_name: str,
+        mla: Literal["more", "less", "all"] = "all",
+        amount: int = None,
+    ) -> Optional[DonorPageSource]:
+        """
+        Page the donors of a bank, or only those above or below an amount.
+
+        Returns None if the bank is hidden.
+        """
+        bank_info = (await self.get_guild_settings(guild.id)).banks.get(bank_name)
+        if not bank_info or bank_info["hidden"]:
+            return None
+
+        index = await self.get_donor_index(guild.id, bank_name)
+        if mla == "all":
+            return DonorPageSource(index, 0, len(index))
+        split = index.count_at_least(amount)
+        if mla == "more":
+            return DonorPageSource(index, 0, split)
+        return DonorPageSource(index, split, len(index), reverse=True)
+
     async def get_user_balance(
         self, guild: discord.Guild, user_id: int, bank_name: str = None
     ) -> discord.Embed:
-        banks = await self.config.guild(guild).banks()
+        banks = (await self.get_guild_settings(guild.id)).banks
         if bank_name:
             bank = banks[bank_name.lower()]
-            donations = bank["donators"].get(str(user_id))
+            donations = (
+                await self.get_member_donations(guild.id, user_id, [bank_name.lower()])
+            )[bank_name.lower()]
             embed = discord.Embed(
                 title=f"[Member not found in guild] ({user_id})",
                 timestamp=discord.utils.utcnow(),
             )
-            if donations is not None:
+            if donations:
                 embed.description = (
                     f"Bank: {bank_name.title()}\n"
                     f"Total amount donated: {bank['emoji']} {cf.humanize_number(donations)}"
@@ -120,31 +849,20 @@ class DonationLogger(nu.Cog):
                 embed.description = "This uesr has no data in this guild."
             return embed
 
-        _dict: Dict[str, Dict[str, Union[str, int]]] = {}
-        for k, v in banks.items():
-            if v["hidden"]:
-                continue
-            donos = v["donators"].get(str(user_id), 0)
-            _dict[k] = {"donations": donos, "emoji": v["emoji"]}
-
-        new_dict = dict(filter(lambda x: x[1]["donations"], _dict.items()))
-        if not new_dict:
+        balance = await self.get_member_balance(guild.id, user_id)
+        if not any(donations for _, _, donations in balance.banks):
             return discord.Embed(
                 title=f"[Member not found in guild] ({user_id})",
                 description="This user has no data in this guild.",
                 timestamp=discord.utils.utcnow(),
             )
 
-        final: Dict[str, str] = {}
-        final_overall = []
-        for key, value in _dict.items():
-            donos = value["donations"]
-            final[key] = f"{value['emoji']} {cf.humanize_number(donos)}"
-            final_overall.append(donos)
-
-        overall = sum(final_overall)
+        final: Dict[str, str] = {
+            k: f"{emoji} {cf.humanize_number(donations)}"
+            for k, emoji, donations in balance.banks
+        }
         embed = discord.Embed(
-            description=f"Overall combined bank donation amount: {cf.humanize_number(overall)}",
+            description=f"Overall combined bank donation amount: {cf.humanize_number(balance.overall)}",
             timestamp=discord.utils.utcnow(),
         )
         embed.set_author(name=f"[Member not found in guild] ({user_id})")
@@ -164,19 +882,13 @@ class DonationLogger(nu.Cog):
     async def get_all_bank_member_dono(
         self, guild: discord.Guild, member: discord.Member
     ) -> discord.Embed:
-        final: Dict[str, str] = {}
-        final_overall = []
-        async with self.config.guild(guild).banks() as banks:
-            for k, v in banks.items():
-                if v["hidden"]:
-                    continue
-                donations = v["donators"].get(str(member.id), 0)
-                final[k] = f"{v['emoji']} {cf.humanize_number(donations)}"
-                final_overall.append(donations)
-
-        overall = sum(final_overall)
+        balance = await self.get_member_balance(guild.id, member.id)
+        final: Dict[str, str] = {
+            k: f"{emoji} {cf.humanize_number(donations)}"
+            for k, emoji, donations in balance.banks
+        }
         embed = discord.Embed(
-            description=f"Overall combined bank donation amount: {cf.humanize_number(overall)}",
+            description=f"Overall combined bank donation amount: {cf.humanize_number(balance.overall)}",
             timestamp=discord.utils.utcnow(),
             colour=member.colour,
         )
@@ -199,13 +911,17 @@ class DonationLogger(nu.Cog):
     async def update_dono_roles(
         self,
         context: commands.Context,
-        d_type: str,
-        donated_amount: int,
+        bank_name: str,
+        previous: int,
+        updated: int,
         member: discord.Member,
-        roles: Dict[str, List[int]],
     ) -> List[discord.Role]:
-        if not await self.config.guild(context.guild).auto_role():
+        if (
+            previous == updated
+            or not (await self.get_guild_settings(context.guild.id)).auto_role
+        ):
             return []
+        d_type = "add" if updated > previous else "remove"
         audit_reason = mod.get_audit_reason(
             author=context.author,
             reason=(
@@ -218,23 +934,14 @@ class DonationLogger(nu.Cog):
             ),
         )
         action = member.add_roles if d_type == "add" else member.remove_roles
-        roles_to_modify: List[discord.Role] = []
-        for k, v in roles.items():
-            for r in v:
-                role = context.guild.get_role(r)
-                if role and (
-                    (
-                        d_type == "add"
-                        and donated_amount >= int(k)
-                        and role not in member.roles
-                    )
-                    or (
-                        d_type == "remove"
-                        and donated_amount < int(k)
-                        and role in member.roles
-                    )
-                ):
-                    roles_to_modify.append(role)
+        table = await self.get_amount_role_table(context.guild.id, bank_name)
+        member_roles = set(member._roles)
+        roles_to_modify: List[discord.Role] = [
+            role
+            for r in table.crossed(previous, updated)
+            if (role := context.guild.get_role(r))
+            and (r in member_roles) != (d_type == "add")
+        ]
 
         if not roles_to_modify:
             return []
@@ -242,6 +949,95 @@ class DonationLogger(nu.Cog):
         await action(*roles_to_modify, reason=audit_reason)
         return roles_to_modify
 
+    async def add_dono_roles_many(
+        self,
+        context: commands.Context,
+        bank_name: str,
+        members: List[discord.Member],
+        results: Dict[int, Tuple[int, int]],
+        auto_role: bool,
+    ) -> Dict[int, List[discord.Role]]:
+        """
+        Add the milestone roles every member reached in a batch of donations.
+        """
+        if not auto_role:
+            return {}
+        audit_reason = mod.get_audit_reason(
+            author=context.author,
+            reason="Automatically added donation roles on member after reaching a donation milestone.",
+        )
+        table = await self.get_amount_role_table(context.guild.id, bank_name)
+        added: Dict[int, List[discord.Role]] = {}
+        for member in members:
+            previous, updated = results[member.id]
+            member_roles = set(member._roles)
+            roles = [
+                role
+                for r in table.crossed(previous, updated)
+                if r not in member_roles and (role := context.guild.get_role(r))
+            ]
+            if not roles:
+                continue
+            try:
+                await member.add_roles(*roles, reason=audit_reason)
+                added[member.id] = roles
+            except discord.HTTPException:
+                continue
+        return added
+
+    async def parse_batch_donations(
+        self, context: commands.Context, raw: str
+    ) -> Tuple[Dict[int, int], Dict[int, discord.Member], List[str]]:
+        amounts: Dict[int, int] = {}
+        members: Dict[int, discord.Member] = {}
+        failed: List[str] = []
+        for pair in raw.split():
+            member_arg, sep, amount_arg = pair.rpartition(":")
+            if not sep or not member_arg:
+                failed.append(f"{pair}: Expected `member:amount`.")
+                continue
+            try:
+                member = await commands.MemberConverter().convert(context, member_arg)
+                amount = await AmountConverter.convert(context, amount_arg)
+            except commands.BadArgument as e:
+                failed.append(f"{pair}: {e}")
+                continue
+            if member.bot:
+                failed.append(f"{pair}: Bots are prohibited from donations.")
+                continue
+            members[member.id] = member
+            amounts[member.id] = amounts.get(member.id, 0) + amount
+        return amounts, members, failed
+
+    async def send_batch_to_log_channel(
+        self, context: commands.Context, log_channel: int, embeds: List[discord.Embed]
+    ):
+        if not log_channel:
+            return
+        channel = context.guild.get_channel(log_channel)
+        view = discord.ui.View().add_item(
+            discord.ui.Button(label="Jump To Command", url=context.message.jump_url)
+        )
+        # Discord allows 10 embeds and 6000 characters per message.
+        chunks: List[List[discord.Embed]] = [[]]
+        size = 0
+        for embed in embeds:
+            if len(chunks[-1]) == 10 or size + len(embed) > 6000:
+                chunks.append([])
+                size = 0
+            chunks[-1].append(embed)
+            size += len(embed)
+        try:
+            for chunk in chunks[:-1]:
+                await channel.send(embeds=chunk)
+            await channel.send(embeds=chunks[-1], view=view)
+        except Exception:
+            await context.send(
+                content="⚠️ Warning: `Log channel not found or I do not have permission to "
+                "send message in the log channel please report this to the admins.`",
+                view=view,
+            )
+
     async def send_to_log_channel(
         self,
         context: commands.Context,
@@ -255,7 +1051,8 @@ class DonationLogger(nu.Cog):
         roles: str = None,
         note: str = None,
     ):
-        logchan = await self.config.guild(context.guild).log_channel()
+        settings = await self.get_guild_settings(context.guild.id)
+        logchan = settings.log_channel
         if not logchan:
             return
 
@@ -311,7 +1108,7 @@ class DonationLogger(nu.Cog):
 
         if roles:
             embed.add_field(name=ra, value=roles, inline=False)
-        elif not await self.config.guild(context.guild).auto_role():
+        elif not settings.auto_role:
             embed.add_field(
                 name=ra,
                 value=f"> Autorole is currently disabled. `{context.prefix}dlset autorole`",
@@ -356,6 +1153,16 @@ class DonationLogger(nu.Cog):
 
         if view.value:
             await self.config.clear_all_guilds()
+            await self.config.clear_all_custom("DONORS")
+            await self.config.clear_all_custom("LEDGER")
+            await self.config.clear_all_users()
+            self.ledger_indexed.clear()
+            self.donor_index.clear()
+            self.ledger_cache.clear()
+            self.member_banks.clear()
+            self.donor_totals.clear()
+            self.amount_role_tables.clear()
+            self.drop_guild_settings()
 
     @donationlogger.command(name="setup")
     @commands.admin_or_permissions(manage_guild=True)
@@ -428,17 +1235,50 @@ class DonationLogger(nu.Cog):
         context: commands.Context,
         bank_name: BankConverter,
         top: Optional[int] = 10,
-        show_left_users: bool = False,
+        show_left_users: Optional[bool] = False,
+        *,
+        flags: LeaderboardFlags,
     ):
         """
         See who has donated the most from a bank.
 
+        **top**: The top number to show. (max 25)
+        **show_left_users**: Whether to show the users who are not in the guild.
+        **--since** and **--until**: Only count donations logged between these dates. (`YYYY-MM-DD`, UTC)
+        Passing only one of them covers 30 days, a range can span at most 366 days. Donations made before the ledger existed are not counted.
+
+        Example:
+        `[p]dono lb dank 10 --since 2024-12-01 --until 2024-12-31`
+        """
+        if top > 25 or top < 1:
+            return await context.send(content="Top number must be between 1-25.")
+        await HYBRIDS.hybrid_leaderboard(
+            self,
+            context,
+            bank_name,
+            top,
+            bool(show_left_users),
+            flags.since,
+            flags.until,
+        )
+
+    @donationlogger.command(name="total")
+    @is_setup_done()
+    async def donationlogger_total(
+        self,
+        context: commands.Context,
+        top: Optional[int] = 10,
+        show_left_users: bool = False,
+    ):
+        """
+        See who has donated the most across all visible banks combined.
+
         **top**: The top number to show. (max 25)
         **show_left_users**: Whether to show the users who are not in the guild.
         """
         if top > 25 or top < 1:
             return await context.send(content="Top number must be between 1-25.")
-        await HYBRIDS.hybrid_leaderboard(self, context, bank_name, top, show_left_users)
+        await HYBRIDS.hybrid_total(self, context, top, show_left_users)
 
     @donationlogger.command(name="add", aliases=["+", "a"])
     @is_setup_done()
@@ -468,6 +1308,27 @@ class DonationLogger(nu.Cog):
 
         await HYBRIDS.hybrid_add(self, context, bank_name, amount, member, note)
 
+    @donationlogger.command(name="batchadd", aliases=["batch"])
+    @is_setup_done()
+    @is_a_dono_manager_or_higher()
+    async def donationlogger_batchadd(
+        self,
+        context: commands.Context,
+        bank_name: BankConverter,
+        *,
+        donations: str,
+    ):
+        """
+        Add bank donations to many members at once.
+
+        Pass `member:amount` pairs separated by spaces or new lines, a member can appear more than once.
+        All donations are applied together and summarised in one log message.
+
+        Example:
+        `[p]dono batchadd dank @member:10m 1234567890:5m @member:2.5e6`
+        """
+        await HYBRIDS.hybrid_batchadd(self, context, bank_name, donations)
+
     @donationlogger.command(name="remove", aliases=["-", "r"])
     @is_setup_done()
     @is_a_dono_manager_or_higher()
@@ -588,6 +1449,7 @@ class DonationLogger(nu.Cog):
 
             async with self.config.guild(context.guild).banks() as banks:
                 banks[bank_name]["multi"] = multiplier
+            self.drop_guild_settings(context.guild.id)
 
     @donationloggerset_bank.command(name="add")
     async def donationloggerset_bank_add(
@@ -612,9 +1474,10 @@ class DonationLogger(nu.Cog):
                     "hidden": hidden,
                     "emoji": str(emoji),
                     "roles": {},
-                    "donators": {},
                 }
             }
+        self.drop_donor_index(context.guild.id, bank_name)
+        self.drop_guild_settings(context.guild.id)
         await context.send(
             content=f"Added {bank_name} with the emoji {str(emoji)} to the banks list."
         )
@@ -633,6 +1496,11 @@ class DonationLogger(nu.Cog):
                     content="This bank is the guild's only bank, you can not remove it."
                 )
             del banks[bank_name]
+        self.drop_guild_settings(context.guild.id)
+        async with self.bank_lock(context.guild.id, bank_name):
+            await self.donor_group(context.guild.id, bank_name).clear()
+            self.drop_donor_index(context.guild.id, bank_name)
+            await self.clear_ledger(context.guild.id, bank_name)
         await context.send(content="That bank is deleted.")
 
     @donationloggerset_bank.command(name="list")
@@ -687,6 +1555,10 @@ class DonationLogger(nu.Cog):
                 banks[bank_name]["roles"] |= {
                     k: [r.id for r in v] for k, v in arole.items()
                 }
+                self.amount_role_tables[(context.guild.id, bank_name)] = (
+                    AmountRoleTable(banks[bank_name]["roles"])
+                )
+            self.drop_guild_settings(context.guild.id)
 
             embed = discord.Embed(
                 title="Amount roles has been set.",
@@ -718,9 +1590,13 @@ class DonationLogger(nu.Cog):
         async with self.config.guild(context.guild).banks() as banks:
             try:
                 del banks[bank_name]["roles"][str(amount)]
+                self.amount_role_tables[(context.guild.id, bank_name)] = (
+                    AmountRoleTable(banks[bank_name]["roles"])
+                )
                 await context.send(content="That amount has been removed.")
             except KeyError:
                 await context.send(content="You haven't registered that amount yet.")
+        self.drop_guild_settings(context.guild.id)
 
     @donationloggerset_bank_amountroles.command(name="list")
     async def donationloggerset_bank_amountroles_list(
@@ -756,13 +1632,15 @@ class DonationLogger(nu.Cog):
         Reset a banks donations or amountroles.
         """
         async with self.config.guild(context.guild).banks() as banks:
-            if roles_or_donators == "amountroles":
-                banks[bank_name]["roles"] = {}
-            elif roles_or_donators == "donators":
-                banks[bank_name]["donators"] = {}
-            else:
+            if roles_or_donators != "donators":
                 banks[bank_name]["roles"] = {}
-                banks[bank_name]["donators"] = {}
+                self.amount_role_tables.pop((context.guild.id, bank_name), None)
+        self.drop_guild_settings(context.guild.id)
+        if roles_or_donators != "amountroles":
+            async with self.bank_lock(context.guild.id, bank_name):
+                await self.donor_group(context.guild.id, bank_name).clear()
+                self.drop_donor_index(context.guild.id, bank_name)
+                await self.clear_ledger(context.guild.id, bank_name)
         _type = (
             roles_or_donators
             if roles_or_donators == "amountroles"
@@ -774,6 +1652,96 @@ class DonationLogger(nu.Cog):
         )
         await context.send(content=f"Bank **{bank_name}** {_type} has been reset.")
 
+    @donationloggerset_bank.command(name="import")
+    async def donationloggerset_bank_import(
+        self, context: commands.Context, bank_name: BankConverter, replace: bool = False
+    ):
+        """
+        Import donor balances into a bank from an attached CSV or JSON file.
+
+        CSV files use `member_id,donations` rows and JSON files a `{"member_id": donations}` object.
+        Every listed member has their balance set to the given amount.
+        Pass `True` to `replace` to also clear the donors that are not in the file.
+        A dry-run summary of the changes is shown before anything is written.
+        The file can be at most 1 MiB and donations must be whole numbers.
+        """
+        if not context.message.attachments:
+            return await context.send_help()
+        attachment = context.message.attachments[0]
+        if attachment.size > self.IMPORT_SIZE_LIMIT:
+            return await context.send(
+                content=f"The file can be at most {self.IMPORT_SIZE_LIMIT // 1024 // 1024} MiB."
+            )
+        raw = (await attachment.read()).decode("utf-8-sig", errors="ignore")
+        balances, failed = parse_donor_table(attachment.filename, raw)
+        if failed:
+            pagified = await nu.pagify_this(
+                "\n".join(failed),
+                "\n",
+                embed_title="Skipped Rows",
+                embed_colour=await context.embed_colour(),
+            )
+            await nu.NoobPaginator(pagified).start(context)
+        if not balances:
+            return await context.send(content="No valid donor rows were found.")
+
+        current = (await self.get_donor_index(context.guild.id, bank_name)).donations
+        target = {} if replace else dict(current)
+        target.update(balances)
+        target = {k: v for k, v in target.items() if v > 0}
+        added = [k for k in target if k not in current]
+        removed = [k for k in current if k not in target]
+        changed = [k for k in target if k in current and target[k] != current[k]]
+        if not (added or removed or changed):
+            return await context.send(
+                content="The file matches the bank's current donors, nothing to import."
+            )
+        sample = "\n".join(
+            f"{k}: {cf.humanize_number(current.get(k, 0))} -> {cf.humanize_number(target.get(k, 0))}"
+            for k in (added + changed + removed)[:10]
+        )
+        conf = (
+            f"Importing into **{bank_name.title()}** will add **{len(added)}**, update "
+            f"**{len(changed)}** and clear **{len(removed)}** donors.\n"
+            f"{cf.box(sample)}Do you want to apply these changes?"
+        )
+        act = f"Imported the donors into **{bank_name.title()}**."
+        view = nu.NoobConfirmation()
+        await view.start(context, act, content=conf)
+        await view.wait()
+        if view.value:
+            await self.import_bank_donors(
+                context.guild.id, bank_name, balances, replace, context.author.id
+            )
+
+    @donationloggerset_bank.command(name="export")
+    async def donationloggerset_bank_export(
+        self,
+        context: commands.Context,
+        bank_name: BankConverter,
+        file_format: Literal["csv", "json"] = "csv",
+    ):
+        """
+        Export a bank's donors as a CSV or JSON file.
+
+        The file can be imported again with `[p]dlset bank import`.
+        """
+        index = await self.get_donor_index(context.guild.id, bank_name)
+        if not len(index):
+            return await context.send(content="This bank has no donors yet.")
+        with tempfile.TemporaryFile() as fp:
+            write_donor_table(fp, index, file_format)
+            if fp.tell() > context.guild.filesize_limit:
+                return await context.send(
+                    content="The export is larger than this guild's upload limit."
+                )
+            fp.seek(0)
+            await context.send(
+                content=f"Exported {cf.humanize_number(len(index))} donors from "
+                f"**{bank_name.title()}**.",
+                file=discord.File(fp, filename=f"{bank_name}_donors.{file_format}"),
+            )
+
     @donationloggerset_bank.command(name="emoji")
     async def donationloggerset_bank_emoji(
         self,
@@ -789,6 +1757,7 @@ class DonationLogger(nu.Cog):
             await context.send(
                 content=f"Successfully changed **{bank_name}**'s emoji to {str(emoji)}"
             )
+        self.drop_guild_settings(context.guild.id)
 
     @donationloggerset_bank.command(name="hidden")
     async def donationloggerset_bank_hidden(
@@ -807,6 +1776,8 @@ class DonationLogger(nu.Cog):
                 banks[bank_name]["hidden"] = hidden == "hide"
                 status = "is now" if hidden == "hide" else "is no longer"
                 await context.send(content=f"Bank **{bank_name}** {status} hidden.")
+            self.donor_totals.pop(context.guild.id, None)
+            self.drop_guild_settings(context.guild.id)
         else:
             all_banks = await self.config.guild(context.guild).banks()
             banks = {k: v for k, v in all_banks.items() if v["hidden"]}
@@ -865,6 +1836,7 @@ class DonationLogger(nu.Cog):
                     else:
                         managers.remove(role.id)
                     success.append(role.mention)
+            self.drop_guild_settings(context.guild.id)
             _type = "added" if add_remove_list == "add" else "removed"
             _type2 = "to" if add_remove_list == "add" else "from"
             if success:
@@ -887,8 +1859,10 @@ class DonationLogger(nu.Cog):
         """
         if not channel:
             await self.config.guild(context.guild).log_channel.clear()
+            self.drop_guild_settings(context.guild.id)
             return await context.send(content="The log channel has been cleared.")
         await self.config.guild(context.guild).log_channel.set(channel.id)
+        self.drop_guild_settings(context.guild.id)
         await context.send(content=f"Set {channel.mention} as the log channel.")
 
     @donationloggerset.command(name="resetguild")
@@ -902,7 +1876,13 @@ class DonationLogger(nu.Cog):
         await view.start(context, act, content=conf)
         await view.wait()
         if view.value:
-            await self.config.guild(context.guild).clear()
+            banks = (await self.get_guild_settings(context.guild.id)).banks
+            async with self.bank_lock(context.guild.id, *banks):
+                await self.config.guild(context.guild).clear()
+                await self.donor_group(context.guild.id).clear()
+                self.drop_donor_index(context.guild.id)
+                await self.clear_ledger(context.guild.id)
+                self.drop_guild_settings(context.guild.id)
 
     @donationloggerset.command(name="autorole")
     async def donationloggerset_autorole(self, context: commands.Context):
@@ -911,9 +1891,73 @@ class DonationLogger(nu.Cog):
         """
         current = await self.config.guild(context.guild).auto_role()
         await self.config.guild(context.guild).auto_role.set(not current)
+        self.drop_guild_settings(context.guild.id)
         status = "will no longer" if current else "will now"
         await context.send(content=f"I {status} automatically add or remove roles.")
 
+    @donationloggerset.command(name="reconcile", aliases=["syncroles"])
+    async def donationloggerset_reconcile(
+        self,
+        context: commands.Context,
+        run_or_status: Literal["run", "status"] = "status",
+    ):
+        """
+        Sync every member's donation roles with their balances, or see the last sync's progress.
+
+        Donation roles are also synced every 12 hours while autorole is enabled.
+        Members are edited one at a time with a short delay, so large guilds can take a while.
+        """
+        if run_or_status == "run":
+            if not (await self.get_guild_settings(context.guild.id)).auto_role:
+                return await context.send(
+                    content=f"Autorole is currently disabled. `{context.prefix}dlset autorole`"
+                )
+            if not context.guild.me.guild_permissions.manage_roles:
+                return await context.send(
+                    content='I require the "Manage Roles" permission to sync roles.'
+                )
+            task = self.reconcile_tasks.get(context.guild.id)
+            if task and not task.done():
+                return await context.send(
+                    content="Donation roles are already being synced in this guild."
+                )
+            self.start_reconcile(context.guild)
+            return await context.send(
+                content="Started syncing donation roles, see the progress with "
+                f"`{context.prefix}dlset reconcile status`."
+            )
+
+        progress = self.reconcile_progress.get(context.guild.id)
+        if not progress:
+            return await context.send(
+                content="Donation roles have not been synced since the cog was loaded."
+            )
+        embed = discord.Embed(
+            title=f"Donation role sync for [{context.guild.name}]",
+            description=f"Status: **{progress.status}**\n"
+            f"Started: <t:{progress.started}:R>\n"
+            + (f"Finished: <t:{progress.finished}:R>" if progress.finished else ""),
+            colour=await context.embed_colour(),
+            timestamp=discord.utils.utcnow(),
+        )
+        embed.add_field(
+            name="Donors scanned:",
+            value=f"{cf.humanize_number(progress.scanned)}/{cf.humanize_number(progress.total)}",
+        )
+        embed.add_field(
+            name="Members edited:",
+            value=f"{cf.humanize_number(progress.edited)} "
+            f"({cf.humanize_number(progress.pending)} queued)",
+        )
+        embed.add_field(
+            name="Roles:",
+            value=f"{cf.humanize_number(progress.added)} added, "
+            f"{cf.humanize_number(progress.removed)} removed, "
+            f"{cf.humanize_number(progress.failed)} failed edits",
+            inline=False,
+        )
+        await context.send(embed=embed)
+
     @donationloggerset.command(name="showsettings", aliases=["ss", "showallsettings"])
     async def donationloggerset_showsettings(self, context: commands.Context):
         """
@@ -1107,6 +2151,8 @@ class DonationLogger(nu.Cog):
         bank_name="The name of the registered bank.",
         top="The top number. (min: 1, max: 25, default: 10)",
         show_left_users="Whether to show the users who are not in the guild.",
+        since="Only count donations logged from this date. (YYYY-MM-DD, UTC)",
+        until="Only count donations logged until this date. (YYYY-MM-DD, UTC)",
     )
     async def slash_donationlogger_leaderboard(
         self,
@@ -1114,6 +2160,8 @@ class DonationLogger(nu.Cog):
         bank_name: app_commands.Transform[str, BankConverter],
         top: app_commands.Range[int, 1, 25] = 10,
         show_left_users: Optional[bool] = False,
+        since: Optional[app_commands.Transform[str, DateConverter]] = None,
+        until: Optional[app_commands.Transform[str, DateConverter]] = None,
     ):
         """_summary_
 
@@ -1121,18 +2169,49 @@ class DonationLogger(nu.Cog):
             interaction (discord.Interaction[Red]): _description_
             bank_name (app_commands.Transform[str, BankConverter]): _description_
             top (app_commands.Range[int, 1, 25]): _description_
-        """
-        if isinstance(bank_name, list):
-            if bank_name[1]:
-                return await interaction.response.send_message(
-                    content=bank_name[0], ephemeral=True
-                )
-            else:
-                return await interaction.response.send_message(content=bank_name[0])
+            since (Optional[app_commands.Transform[str, DateConverter]]): _description_
+            until (Optional[app_commands.Transform[str, DateConverter]]): _description_
+        """
+        for arg in (bank_name, since, until):
+            if isinstance(arg, list):
+                if arg[1]:
+                    return await interaction.response.send_message(
+                        content=arg[0], ephemeral=True
+                    )
+                else:
+                    return await interaction.response.send_message(content=arg[0])
         await HYBRIDS.hybrid_leaderboard(
-            self, interaction, bank_name, top, show_left_users
+            self, interaction, bank_name, top, show_left_users, since, until
         )
 
+    @slash_donologger.command(
+        name="total",
+        description="See who has donated the most across all visible banks combined.",
+    )
+    @app_commands.describe(
+        top="The top number. (min: 1, max: 25, default: 10)",
+        show_left_users="Whether to show the users who are not in the guild.",
+    )
+    async def slash_donationlogger_total(
+        self,
+        interaction: discord.Interaction[Red],
+        top: app_commands.Range[int, 1, 25] = 10,
+        show_left_users: Optional[bool] = False,
+    ):
+        """_summary_
+
+        Args:
+            interaction (discord.Interaction[Red]): _description_
+            top (app_commands.Range[int, 1, 25]): _description_
+            show_left_users (Optional[bool]): _description_
+        """
+        if not await check_if_setup_done(interaction):
+            return await interaction.response.send_message(
+                content="DonationLogger has not been setup in this guild yet.",
+                ephemeral=True,
+            )
+        await HYBRIDS.hybrid_total(self, interaction, top, show_left_users)
+
     @slash_donologger.command(
         name="add", description="Add bank donation amount to a member or yourself."
     )
@@ -1185,6 +2264,35 @@ class DonationLogger(nu.Cog):
                 return await interaction.response.send_message(content=amount[0])
         await HYBRIDS.hybrid_add(self, interaction, bank_name, amount, member, note)
 
+    @slash_donologger.command(
+        name="batchadd", description="Add bank donations to many members at once."
+    )
+    @app_commands.describe(
+        bank_name="The name of the registered bank.",
+        donations="Space separated member:amount pairs. (example: @member:10m 1234567890:5m)",
+    )
+    async def slash_donationlogger_batchadd(
+        self,
+        interaction: discord.Interaction[Red],
+        bank_name: app_commands.Transform[str, BankConverter],
+        donations: str,
+    ):
+        """_summary_
+
+        Args:
+            interaction (discord.Interaction[Red]): _description_
+            bank_name (app_commands.Transform[str, BankConverter]): _description_
+            donations (str): _description_
+        """
+        if isinstance(bank_name, list):
+            if bank_name[1]:
+                return await interaction.response.send_message(
+                    content=bank_name[0], ephemeral=True
+                )
+            else:
+                return await interaction.response.send_message(content=bank_name[0])
+        await HYBRIDS.hybrid_batchadd(self, interaction, bank_name, donations)
+
     @slash_donologger.command(
         name="remove",
         description="Remove bank donation amount to a member or yourself.",
@@ -1,4 +1,5 @@
 import asyncio
+import datetime as dt
 import discord
 import noobutils as nu
 import random
@@ -6,14 +7,14 @@ import random
 from redbot.core.bot import commands, Red
 from redbot.core.utils import chat_formatting as cf, mod
 
-from typing import Literal, TYPE_CHECKING, Union
+from typing import Dict, List, Literal, Tuple, TYPE_CHECKING, Union
 
 from .checks import (
     check_if_is_a_dono_manager_or_higher,
     check_if_setup_done,
     has_dono_permissions,
 )
-from .views import DonationLoggerSetupView, TotalDonoView
+from .views import DonationLoggerSetupView, DonorPagesView, TotalDonoView
 
 if TYPE_CHECKING:
     from . import DonationLogger
@@ -66,7 +67,7 @@ class HYBRIDS:
                     content="You need to be a guild admin or a guild manager + to run this command.",
                     ephemeral=True,
                 )
-        if await cog.config.guild(obj.guild).setup():
+        if (await cog.get_guild_settings(obj.guild.id)).setup:
             content = (
                 "It appears this guild is already set up, "
                 "you can run this command again when you reset this guild."
@@ -109,7 +110,7 @@ class HYBRIDS:
                     content='I require the "Embed Links" permission to run this command.',
                     ephemeral=True,
                 )
-            if not check_if_setup_done(obj):
+            if not await check_if_setup_done(obj):
                 return await cls.hybrid_send(
                     obj,
                     content="DonationLogger has not been setup in this guild yet.",
@@ -121,6 +122,7 @@ class HYBRIDS:
                     content="You need to be a donationlogger manager or higher to run this command.",
                     ephemeral=True,
                 )
+        author = obj.author if isinstance(obj, commands.Context) else obj.user
         if not bank_name:
             act = f"Successfully cleared all bank donations from **{user.name}**."
             conf = f"Are you sure you want to erase all bank donations from **{user.name}**?"
@@ -128,11 +130,11 @@ class HYBRIDS:
             await view.start(obj, act, content=conf)
             await view.wait()
             if view.value:
-                async with cog.config.guild(obj.guild).banks() as banks:
-                    for bank in banks.values():
-                        donos = bank["donators"].get(str(user.id))
-                        if donos is not None:
-                            del bank["donators"][str(user.id)]
+                for bank in (await cog.get_guild_settings(obj.guild.id)).banks:
+                    async with cog.member_lock(obj.guild.id, bank, user.id):
+                        await cog.set_member_donations(
+                            obj.guild.id, bank, user.id, 0, author.id
+                        )
             return
         act = f"Successfully cleared **{bank_name.title()}** donations from **{user.name}**."
         conf = f"Are you sure you want to clear **{bank_name.title()}** donations from **{user.name}**"
@@ -140,10 +142,10 @@ class HYBRIDS:
         await view.start(obj, act, content=conf)
         await view.wait()
         if view.value:
-            async with cog.config.guild(obj.guild).banks() as banks:
-                donations = banks[bank_name.lower()]["donators"].get(str(user.id))
-                if donations is not None:
-                    del banks[bank_name.lower()]["donators"][str(user.id)]
+            async with cog.member_lock(obj.guild.id, bank_name, user.id):
+                await cog.set_member_donations(
+                    obj.guild.id, bank_name, user.id, 0, author.id
+                )
 
     @classmethod
     async def hybrid_balance(
@@ -163,26 +165,28 @@ class HYBRIDS:
                 ephemeral=True,
             )
         if bank_name:
-            async with cog.config.guild(obj.guild).banks() as banks:
-                bank = banks[bank_name.lower()]
-                if bank["hidden"]:
-                    return await cls.hybrid_send(obj, content="This bank is hidden")
-                donations = bank["donators"].get(str(member.id), 0)
-                embed = discord.Embed(
-                    title=f"{member.name} ({member.id})",
-                    description=(
-                        f"Bank: {bank_name.title()}\n"
-                        f"Total amount donated: {bank['emoji']} {cf.humanize_number(donations)}"
-                    ),
-                    timestamp=discord.utils.utcnow(),
-                    colour=member.colour,
-                )
-                embed.set_thumbnail(url=nu.is_have_avatar(member))
-                embed.set_footer(
-                    text=f"{obj.guild.name} admires your donations!",
-                    icon_url=nu.is_have_avatar(obj.guild),
-                )
-                return await cls.hybrid_send(obj, embed=embed)
+            banks = (await cog.get_guild_settings(obj.guild.id)).banks
+            bank = banks[bank_name.lower()]
+            if bank["hidden"]:
+                return await cls.hybrid_send(obj, content="This bank is hidden")
+            donations = await cog.donor_group(
+                obj.guild.id, bank_name, member.id
+            ).donations()
+            embed = discord.Embed(
+                title=f"{member.name} ({member.id})",
+                description=(
+                    f"Bank: {bank_name.title()}\n"
+                    f"Total amount donated: {bank['emoji']} {cf.humanize_number(donations)}"
+                ),
+                timestamp=discord.utils.utcnow(),
+                colour=member.colour,
+            )
+            embed.set_thumbnail(url=nu.is_have_avatar(member))
+            embed.set_footer(
+                text=f"{obj.guild.name} admires your donations!",
+                icon_url=nu.is_have_avatar(obj.guild),
+            )
+            return await cls.hybrid_send(obj, embed=embed)
         embed = await cog.get_all_bank_member_dono(obj.guild, member)
         await cls.hybrid_send(obj, embed=embed)
 
@@ -208,64 +212,24 @@ class HYBRIDS:
             ctx: commands.Context = obj
         else:
             ctx: commands.Context = await obj.client.get_context(obj)
-        if mla == "all":
-            embeds = await cog.get_dc_from_bank(ctx, bank_name)
-            if not embeds:
-                return await cls.hybrid_send(obj, content="This bank is hidden.")
-            await nu.NoobPaginator(embeds).start(obj)
-            return
-
-        if not amount:
+        if mla != "all" and not amount:
             return await ctx.send_help()
 
-        banks_config = await cog.config.guild(obj.guild).banks()
-        bank_data = banks_config.get(bank_name.lower(), {})
-        if bank_data.get("hidden"):
+        source = await cog.get_dc_from_bank(obj.guild, bank_name.lower(), mla, amount)
+        if source is None:
             return await cls.hybrid_send(obj, content="This bank is hidden.")
-
-        donators = bank_data.get("donators", {})
-        filtered_donators = {
-            k: v
-            for k, v in donators.items()
-            if (mla == "more" and v >= amount) or (mla == "less" and v < amount)
-        }
-
-        sorted_donators = sorted(
-            filtered_donators.items(), key=lambda u: u[1], reverse=(mla == "more")
-        )
-
-        output_list = []
-        for index, (donator_id, donation_amount) in enumerate(sorted_donators, 1):
-            member = obj.guild.get_member(int(donator_id))
-            mention = (
-                f"{member.mention} (`{member.id}`)"
-                if member
-                else f"Member not found in server. (`{donator_id}`)"
-            )
-            e = (
-                "➡️ "
-                if member and member.id == (getattr(obj, "user", obj.author)).id
-                else ""
+        if mla == "all":
+            title = f"All of the donors for [{bank_name.title()}]"
+            empty = "It seems no one has donated from this bank yet."
+        else:
+            title = (
+                f"All members who have donated {mla} than {cf.humanize_number(amount)} "
+                f"for [{bank_name.title()}]"
             )
-            output_list.append(
-                f"{e}{index}. {mention}: **{cf.humanize_number(donation_amount)}**"
+            empty = (
+                f"No one has donated {mla} than **{cf.humanize_number(amount)}** yet."
             )
-
-        output_text = "\n".join(
-            output_list
-            or [f"No one has donated {mla} than **{cf.humanize_number(amount)}** yet."]
-        )
-
-        paginated_output = await nu.pagify_this(
-            output_text,
-            "\n",
-            "Page ({index}/{pages})",
-            embed_title=f"All members who have donated {mla} than {cf.humanize_number(amount)} "
-            f"for [{bank_name.title()}]",
-            embed_colour=await ctx.embed_colour(),
-        )
-
-        await nu.NoobPaginator(paginated_output).start(obj)
+        await DonorPagesView(source, title, empty).start(ctx)
 
     @classmethod
     async def hybrid_leaderboard(
@@ -275,6 +239,8 @@ class HYBRIDS:
         bank_name: str,
         top: int,
         show_left_users: bool,
+        since: dt.datetime = None,
+        until: dt.datetime = None,
     ):
         if (
             isinstance(obj, discord.Interaction)
@@ -285,24 +251,47 @@ class HYBRIDS:
                 content='I require the "Embed Links" permission to run this command.',
                 ephemeral=True,
             )
-        banks = await cog.config.guild(obj.guild).banks()
+        banks = (await cog.get_guild_settings(obj.guild.id)).banks
         if banks[bank_name.lower()]["hidden"]:
             return await cls.hybrid_send(obj, content="This bank is hidden.")
-        donors = banks[bank_name.lower()]["donators"]
+        if since or until:
+            # A given end date counts up to the last second of that day.
+            end = (
+                until + dt.timedelta(days=1, seconds=-1)
+                if until
+                else dt.datetime.now(dt.timezone.utc)
+            )
+            until = until or end
+            since = since or until - dt.timedelta(days=30)
+            if since > until:
+                return await cls.hybrid_send(
+                    obj,
+                    content="The start date must be before the end date.",
+                    ephemeral=True,
+                )
+            if (until - since).days >= cog.LEDGER_RANGE_LIMIT:
+                return await cls.hybrid_send(
+                    obj,
+                    content=f"The range can span at most {cog.LEDGER_RANGE_LIMIT} days.",
+                    ephemeral=True,
+                )
+            if isinstance(obj, discord.Interaction):
+                await obj.response.defer()
+            donor_index = await cog.get_ledger_totals(
+                obj.guild.id, bank_name, since, end
+            )
+        else:
+            donor_index = await cog.get_donor_index(obj.guild.id, bank_name)
         emoji = banks[bank_name.lower()]["emoji"]
-        filtered_donors = {}
-        for i, j in donors.items():
-            if j <= 0:
-                continue
-            memb = obj.guild.get_member(int(i))
+        sorted_donors: List[Tuple[str, int]] = []
+        for i, j in donor_index:
+            memb = obj.guild.get_member(i)
             if not memb and not show_left_users:
                 continue
             member = memb.name if memb else f"[Member not found in guild] ({i})"
-            filtered_donors[member] = j
-
-        sorted_donors = dict(
-            sorted(filtered_donors.items(), key=lambda m: m[1], reverse=True)
-        )
+            sorted_donors.append((member, j))
+            if len(sorted_donors) >= top:
+                break
         embed = discord.Embed(
             title=f"Top {top} donators for [{bank_name.title()}]",
             colour=random.randint(0, 0xFFFFFF),
@@ -310,11 +299,18 @@ class HYBRIDS:
         )
         embed.set_footer(text=obj.guild.name)
         embed.set_thumbnail(url=nu.is_have_avatar(obj.guild))
+        if since:
+            embed.description = (
+                f"Range: <t:{round(since.timestamp())}:d> - "
+                f"<t:{round(until.timestamp())}:d>"
+            )
         if not sorted_donors:
-            embed.description = "It seems no one has donated from this bank yet."
-        for index, (k, v) in enumerate(sorted_donors.items(), 1):
-            if index > top:
-                break
+            embed.description = (
+                "It seems no one has donated from this bank in that range."
+                if since
+                else "It seems no one has donated from this bank yet."
+            )
+        for index, (k, v) in enumerate(sorted_donors, 1):
             embed.add_field(
                 name=f"{index}. {k}",
                 value=f"{emoji} {cf.humanize_number(v)}",
@@ -322,6 +318,48 @@ class HYBRIDS:
             )
         await cls.hybrid_send(obj, embed=embed)
 
+    @classmethod
+    async def hybrid_total(
+        cls,
+        cog: "DonationLogger",
+        obj: Union[commands.Context, discord.Interaction[Red]],
+        top: int,
+        show_left_users: bool,
+    ):
+        if (
+            isinstance(obj, discord.Interaction)
+            and not obj.channel.permissions_for(obj.guild.me).embed_links
+        ):
+            return await cls.hybrid_send(
+                obj,
+                content='I require the "Embed Links" permission to run this command.',
+                ephemeral=True,
+            )
+        totals = await cog.get_donor_totals(obj.guild.id)
+        sorted_donors: List[Tuple[str, int]] = []
+        for i, j in totals:
+            memb = obj.guild.get_member(i)
+            if not memb and not show_left_users:
+                continue
+            member = memb.name if memb else f"[Member not found in guild] ({i})"
+            sorted_donors.append((member, j))
+            if len(sorted_donors) >= top:
+                break
+        embed = discord.Embed(
+            title=f"Top {top} overall donators for [{obj.guild.name}]",
+            colour=random.randint(0, 0xFFFFFF),
+            timestamp=discord.utils.utcnow(),
+        )
+        embed.set_footer(text="Combined donations across all visible banks.")
+        embed.set_thumbnail(url=nu.is_have_avatar(obj.guild))
+        if not sorted_donors:
+            embed.description = "It seems no one has donated in this guild yet."
+        for index, (k, v) in enumerate(sorted_donors, 1):
+            embed.add_field(
+                name=f"{index}. {k}", value=cf.humanize_number(v), inline=False
+            )
+        await cls.hybrid_send(obj, embed=embed)
+
     @classmethod
     async def hybrid_add(
         cls,
@@ -339,7 +377,7 @@ class HYBRIDS:
                     content='I require the "Embed Links" permission to run this command.',
                     ephemeral=True,
                 )
-            if not check_if_setup_done(obj):
+            if not await check_if_setup_done(obj):
                 return await cls.hybrid_send(
                     obj,
                     content="DonationLogger has not been setup in this guild yet.",
@@ -355,62 +393,201 @@ class HYBRIDS:
             ctx = obj
         else:
             ctx = await obj.client.get_context(obj)
-        async with cog.config.guild(obj.guild).banks() as banks:
-            bank = banks[bank_name.lower()]
-            emoji = bank["emoji"]
-            if bank["hidden"]:
-                return await cls.hybrid_send(obj, content="This bank is hidden.")
-            multi = bank.get("multi")
-            if multi:
-                amount = round(amount * multi)
-            if amount > 999999999999999:
+        banks = (await cog.get_guild_settings(obj.guild.id)).banks
+        bank = banks[bank_name.lower()]
+        if bank["hidden"]:
+            return await cls.hybrid_send(obj, content="This bank is hidden.")
+        multi = bank.get("multi")
+        if multi:
+            amount = round(amount * multi)
+        if amount > 999999999999999:
+            return await cls.hybrid_send(
+                obj,
+                ephemeral=True,
+                content="The amount you provided is way too high, consider adding something reasonable.",
+            )
+        donations = cog.donor_group(obj.guild.id, bank_name, member.id).donations
+        async with cog.member_lock(obj.guild.id, bank_name, member.id):
+            previous = await donations()
+            updated = previous + amount
+            await cog.set_member_donations(
+                obj.guild.id, bank_name, member.id, updated, ctx.author.id
+            )
+        if isinstance(obj, discord.Interaction) and not obj.response.is_done():
+            await obj.response.defer()
+        cog.queue_side_effect(
+            obj.guild.id,
+            cls.after_add(
+                cog, ctx, bank_name, bank, amount, previous, updated, member, note
+            ),
+        )
+
+    @classmethod
+    async def after_add(
+        cls,
+        cog: "DonationLogger",
+        ctx: commands.Context,
+        bank_name: str,
+        bank: dict,
+        amount: int,
+        previous: int,
+        updated: int,
+        member: discord.Member,
+        note: str = None,
+    ):
+        emoji = bank["emoji"]
+        multi = bank.get("multi")
+        donated = cf.humanize_number(amount)
+        total = cf.humanize_number(updated)
+        roles = await cog.update_dono_roles(ctx, bank_name, previous, updated, member)
+        humanized_roles = cf.humanize_list([role.mention for role in roles])
+        rep = (
+            f"{emoji} **{donated}** was added to **{member.name}**'s **__{bank_name.title()}__** "
+            f"donation balance.\nTheir total donation balance is now **{emoji} {total}** on "
+            f"**__{bank_name.title()}__**."
+        )
+        embed = discord.Embed(
+            title="Successfully Added",
+            description=rep,
+            colour=member.colour,
+            timestamp=discord.utils.utcnow(),
+        )
+        if multi:
+            embed.set_footer(text=f"Donation Multiplier: x{multi}")
+        if humanized_roles:
+            embed.add_field(
+                name="Added Donation Roles:", value=humanized_roles, inline=False
+            )
+        await TotalDonoView(cog).start(ctx, member, content=member.mention, embed=embed)
+        await cog.send_to_log_channel(
+            ctx,
+            "add",
+            bank_name,
+            emoji,
+            amount,
+            previous,
+            updated,
+            member,
+            humanized_roles,
+            note,
+        )
+
+    @classmethod
+    async def hybrid_batchadd(
+        cls,
+        cog: "DonationLogger",
+        obj: Union[commands.Context, discord.Interaction[Red]],
+        bank_name: str,
+        donations: str,
+    ):
+        if isinstance(obj, discord.Interaction):
+            if not obj.channel.permissions_for(obj.guild.me).embed_links:
+                return await cls.hybrid_send(
+                    obj,
+                    content='I require the "Embed Links" permission to run this command.',
+                    ephemeral=True,
+                )
+            if not await check_if_setup_done(obj):
+                return await cls.hybrid_send(
+                    obj,
+                    content="DonationLogger has not been setup in this guild yet.",
+                    ephemeral=True,
+                )
+            if not await check_if_is_a_dono_manager_or_higher(obj):
                 return await cls.hybrid_send(
                     obj,
+                    content="You need to be a donationlogger manager or higher to run this command.",
                     ephemeral=True,
-                    content="The amount you provided is way too high, consider adding something reasonable.",
                 )
-            bank["donators"].setdefault(str(member.id), 0)
-            bank["donators"][str(member.id)] += amount
-            updated = bank["donators"][str(member.id)]
-            previous = updated - amount
-            donated = cf.humanize_number(amount)
-            total = cf.humanize_number(updated)
-            roles = await cog.update_dono_roles(
-                ctx, "add", updated, member, bank["roles"]
+        if isinstance(obj, commands.Context):
+            ctx = obj
+        else:
+            ctx = await obj.client.get_context(obj)
+        banks = (await cog.get_guild_settings(obj.guild.id)).banks
+        bank = banks[bank_name.lower()]
+        if bank["hidden"]:
+            return await cls.hybrid_send(obj, content="This bank is hidden.")
+        if len(donations.split()) > cog.BATCH_LIMIT:
+            return await cls.hybrid_send(
+                obj,
+                content=f"You can only add up to {cog.BATCH_LIMIT} donations at once.",
             )
-            humanized_roles = cf.humanize_list([role.mention for role in roles])
-            rep = (
-                f"{emoji} **{donated}** was added to **{member.name}**'s **__{bank_name.title()}__** "
-                f"donation balance.\nTheir total donation balance is now **{emoji} {total}** on "
-                f"**__{bank_name.title()}__**."
+        if isinstance(obj, discord.Interaction) and not obj.response.is_done():
+            await obj.response.defer()
+        amounts, members, failed = await cog.parse_batch_donations(ctx, donations)
+        if failed:
+            skipped = "\n".join(failed[:20])
+            if len(failed) > 20:
+                skipped += f"\n... and {len(failed) - 20} more."
+            await cls.hybrid_send(
+                obj, content=f"Skipped these entries:\n{cf.box(skipped)}"
             )
-            embed = discord.Embed(
-                title="Successfully Added",
-                description=rep,
-                colour=member.colour,
-                timestamp=discord.utils.utcnow(),
+        if not amounts:
+            return await cls.hybrid_send(
+                obj, content="There are no valid donations to add."
             )
-            if multi:
-                embed.set_footer(text=f"Donation Multiplier: x{multi}")
-            if humanized_roles:
-                embed.add_field(
-                    name="Added Donation Roles:", value=humanized_roles, inline=False
-                )
-            await TotalDonoView(cog).start(
-                ctx, member, content=member.mention, embed=embed
+        multi = bank.get("multi") or 1
+        if any(round(a * multi) > 999999999999999 for a in amounts.values()):
+            return await cls.hybrid_send(
+                obj,
+                content="One of the amounts you provided is way too high, consider adding something reasonable.",
             )
-            await cog.send_to_log_channel(
-                ctx,
-                "add",
-                bank_name,
-                emoji,
-                amount,
-                previous,
-                updated,
-                member,
-                humanized_roles,
-                note,
+        results = await cog.bank_credit_many(
+            obj.guild, bank_name, amounts, actor_id=ctx.author.id
+        )
+        cog.queue_side_effect(
+            obj.guild.id,
+            cls.after_batchadd(
+                cog, ctx, bank_name, bank, results, list(members.values())
+            ),
+        )
+
+    @classmethod
+    async def after_batchadd(
+        cls,
+        cog: "DonationLogger",
+        ctx: commands.Context,
+        bank_name: str,
+        bank: dict,
+        results: Dict[int, Tuple[int, int]],
+        members: List[discord.Member],
+    ):
+        emoji = bank["emoji"]
+        multi = bank.get("multi")
+        settings = await cog.get_guild_settings(ctx.guild.id)
+        roles = await cog.add_dono_roles_many(
+            ctx, bank_name, members, results, settings.auto_role
+        )
+        total = sum(updated - previous for previous, updated in results.values())
+        lines = []
+        for member in sorted(
+            members, key=lambda m: results[m.id][1] - results[m.id][0], reverse=True
+        ):
+            previous, updated = results[member.id]
+            line = (
+                f"{member.mention}: {emoji} +{cf.humanize_number(updated - previous)} "
+                f"→ {emoji} {cf.humanize_number(updated)}"
             )
+            if added := roles.get(member.id):
+                line += f" ({cf.humanize_list([role.mention for role in added])})"
+            lines.append(line)
+        footer = f"Authorized by: {ctx.author} ({ctx.author.id})".replace("{", "{{")
+        footer = footer.replace("}", "}}")
+        if multi:
+            footer += f" · Donation Multiplier: x{multi}"
+        embeds = await nu.pagify_this(
+            "\n".join(lines),
+            "\n",
+            "Page ({index}/{pages}) · " + footer,
+            embed_title=(
+                f"{emoji} {cf.humanize_number(total)} was added to {len(results)} "
+                f"members on {bank_name.title()}"
+            ),
+            embed_colour=await ctx.embed_colour(),
+            footer_icon=nu.is_have_avatar(ctx.author),
+        )
+        await nu.NoobPaginator(embeds).start(ctx)
+        await cog.send_batch_to_log_channel(ctx, settings.log_channel, embeds)
 
     @classmethod
     async def hybrid_remove(
@@ -429,7 +606,7 @@ class HYBRIDS:
                     content='I require the "Embed Links" permission to run this command.',
                     ephemeral=True,
                 )
-            if not check_if_setup_done(obj):
+            if not await check_if_setup_done(obj):
                 return await cls.hybrid_send(
                     obj,
                     content="DonationLogger has not been setup in this guild yet.",
@@ -445,60 +622,77 @@ class HYBRIDS:
             ctx: commands.Context = obj
         else:
             ctx: commands.Context = await obj.client.get_context(obj)
-        async with cog.config.guild(obj.guild).banks() as banks:
-            bank = banks[bank_name.lower()]
-            donators = bank["donators"]
-            emoji = bank["emoji"]
-            member_id = str(member.id)
-            if bank["hidden"]:
-                return await cls.hybrid_send(obj, content="This bank is hidden.")
-            d = donators.get(member_id)
-            if d == 0 or d is None:
-                return await cls.hybrid_send(
-                    obj, content="This member has 0 donation balance for this bank."
-                )
-            donators[member_id] -= amount
-            updated1 = donators[member_id]
-            if updated1 < 0:
-                del donators[member_id]
-            updated2 = donators.get(member_id, 0)
-            previous = updated1 + amount
-            donated = cf.humanize_number(amount)
-            total = cf.humanize_number(updated2)
-            roles = await cog.update_dono_roles(
-                ctx, "remove", updated2, member, bank["roles"]
-            )
-            humanized_roles = cf.humanize_list([role.mention for role in roles])
-            rep = (
-                f"{emoji} **{donated}** was removed from **{member.name}**'s **__{bank_name.title()}__** "
-                f"donation balance.\nTheir total donation balance is now **{emoji} {total}** on "
-                f"**__{bank_name.title()}__**."
-            )
-            embed = discord.Embed(
-                title="Successfully Removed",
-                description=rep,
-                colour=member.colour,
-                timestamp=discord.utils.utcnow(),
-            )
-            if humanized_roles:
-                embed.add_field(
-                    name="Removed Donation Roles:", value=humanized_roles, inline=False
+        banks = (await cog.get_guild_settings(obj.guild.id)).banks
+        bank = banks[bank_name.lower()]
+        if bank["hidden"]:
+            return await cls.hybrid_send(obj, content="This bank is hidden.")
+        donations = cog.donor_group(obj.guild.id, bank_name, member.id).donations
+        async with cog.member_lock(obj.guild.id, bank_name, member.id):
+            previous = await donations()
+            updated2 = max(previous - amount, 0)
+            if previous:
+                await cog.set_member_donations(
+                    obj.guild.id, bank_name, member.id, updated2, ctx.author.id
                 )
-            await TotalDonoView(cog).start(
-                ctx, member, content=member.mention, embed=embed
+        if not previous:
+            return await cls.hybrid_send(
+                obj, content="This member has 0 donation balance for this bank."
             )
-            await cog.send_to_log_channel(
-                ctx,
-                "remove",
-                bank_name,
-                emoji,
-                amount,
-                previous,
-                updated2,
-                member,
-                humanized_roles,
-                note,
+        if isinstance(obj, discord.Interaction) and not obj.response.is_done():
+            await obj.response.defer()
+        cog.queue_side_effect(
+            obj.guild.id,
+            cls.after_remove(
+                cog, ctx, bank_name, bank, amount, previous, updated2, member, note
+            ),
+        )
+
+    @classmethod
+    async def after_remove(
+        cls,
+        cog: "DonationLogger",
+        ctx: commands.Context,
+        bank_name: str,
+        bank: dict,
+        amount: int,
+        previous: int,
+        updated2: int,
+        member: discord.Member,
+        note: str = None,
+    ):
+        emoji = bank["emoji"]
+        donated = cf.humanize_number(amount)
+        total = cf.humanize_number(updated2)
+        roles = await cog.update_dono_roles(ctx, bank_name, previous, updated2, member)
+        humanized_roles = cf.humanize_list([role.mention for role in roles])
+        rep = (
+            f"{emoji} **{donated}** was removed from **{member.name}**'s **__{bank_name.title()}__** "
+            f"donation balance.\nTheir total donation balance is now **{emoji} {total}** on "
+            f"**__{bank_name.title()}__**."
+        )
+        embed = discord.Embed(
+            title="Successfully Removed",
+            description=rep,
+            colour=member.colour,
+            timestamp=discord.utils.utcnow(),
+        )
+        if humanized_roles:
+            embed.add_field(
+                name="Removed Donation Roles:", value=humanized_roles, inline=False
             )
+        await TotalDonoView(cog).start(ctx, member, content=member.mention, embed=embed)
+        await cog.send_to_log_channel(
+            ctx,
+            "remove",
+            bank_name,
+            emoji,
+            amount,
+            previous,
+            updated2,
+            member,
+            humanized_roles,
+            note,
+        )
 
     @classmethod
     async def hybrid_set(
@@ -516,7 +710,7 @@ class HYBRIDS:
                     content='I require the "Embed Links" permission to run this command.',
                     ephemeral=True,
                 )
-            if not check_if_setup_done(obj):
+            if not await check_if_setup_done(obj):
                 return await cls.hybrid_send(
                     obj,
                     content="DonationLogger has not been setup in this guild yet.",
@@ -532,50 +726,62 @@ class HYBRIDS:
             ctx: commands.Context = obj
         else:
             ctx: commands.Context = await obj.client.get_context(obj)
-        async with cog.config.guild(obj.guild).banks() as banks:
-            bank = banks[bank_name.lower()]
-            donators = bank["donators"]
-            emoji = bank["emoji"]
-            if bank["hidden"]:
-                return await cls.hybrid_send(obj, content="This bank is hidden.")
-            donators.setdefault(str(member.id), 0)
-            previous = donators[str(member.id)]
-            donators[str(member.id)] = amount
-            aroles = await cog.update_dono_roles(
-                ctx, "add", amount, member, bank["roles"]
-            )
-            rrole = await cog.update_dono_roles(
-                ctx, "remove", amount, member, bank["roles"]
-            )
-            roles = aroles + rrole
-            humanized_roles = cf.humanize_list([role.mention for role in roles])
-            rep = (
-                f"{emoji} **{cf.humanize_number(amount)}** was set as **{member.name}**'s "
-                f"**__{bank_name.title()}__** donation balance."
-            )
-            embed = discord.Embed(
-                title="Successfully Set",
-                description=rep,
-                colour=member.colour,
-                timestamp=discord.utils.utcnow(),
-            )
-            if humanized_roles:
-                embed.add_field(
-                    name="Added/Removed Donation Roles:",
-                    value=humanized_roles,
-                    inline=False,
-                )
-            await TotalDonoView(cog).start(
-                ctx, member, content=member.mention, embed=embed
+        banks = (await cog.get_guild_settings(obj.guild.id)).banks
+        bank = banks[bank_name.lower()]
+        if bank["hidden"]:
+            return await cls.hybrid_send(obj, content="This bank is hidden.")
+        donations = cog.donor_group(obj.guild.id, bank_name, member.id).donations
+        async with cog.member_lock(obj.guild.id, bank_name, member.id):
+            previous = await donations()
+            await cog.set_member_donations(
+                obj.guild.id, bank_name, member.id, amount, ctx.author.id
             )
-            await cog.send_to_log_channel(
-                ctx,
-                "set",
-                bank_name,
-                emoji,
-                amount,
-                previous,
-                amount,
-                member,
-                humanized_roles,
+        if isinstance(obj, discord.Interaction) and not obj.response.is_done():
+            await obj.response.defer()
+        cog.queue_side_effect(
+            obj.guild.id,
+            cls.after_set(cog, ctx, bank_name, bank, amount, previous, member),
+        )
+
+    @classmethod
+    async def after_set(
+        cls,
+        cog: "DonationLogger",
+        ctx: commands.Context,
+        bank_name: str,
+        bank: dict,
+        amount: int,
+        previous: int,
+        member: discord.Member,
+    ):
+        emoji = bank["emoji"]
+        roles = await cog.update_dono_roles(ctx, bank_name, previous, amount, member)
+        humanized_roles = cf.humanize_list([role.mention for role in roles])
+        rep = (
+            f"{emoji} **{cf.humanize_number(amount)}** was set as **{member.name}**'s "
+            f"**__{bank_name.title()}__** donation balance."
+        )
+        embed = discord.Embed(
+            title="Successfully Set",
+            description=rep,
+            colour=member.colour,
+            timestamp=discord.utils.utcnow(),
+        )
+        if humanized_roles:
+            embed.add_field(
+                name="Added/Removed Donation Roles:",
+                value=humanized_roles,
+                inline=False,
             )
+        await TotalDonoView(cog).start(ctx, member, content=member.mention, embed=embed)
+        await cog.send_to_log_channel(
+            ctx,
+            "set",
+            bank_name,
+            emoji,
+            amount,
+            previous,
+            amount,
+            member,
+            humanized_roles,
+        )
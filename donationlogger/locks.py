@@ -0,0 +1,81 @@
+import asyncio
+import contextlib
+
+from typing import Dict, Hashable, Iterable, List
+
+
+class _LockState:
+    __slots__ = ("condition", "readers", "writer", "waiting", "users")
+
+    def __init__(self):
+        self.condition = asyncio.Condition()
+        self.readers = 0
+        self.writer = False
+        self.waiting = 0
+        self.users = 0
+
+
+class KeyedLocks:
+    """
+    Shared and exclusive asyncio locks created on demand per key.
+
+    Keys are always acquired in sorted order so holding several of them can't deadlock,
+    a key is forgotten once nobody holds or waits for it. Waiting exclusive holders
+    block new shared holders so bulk writes are not starved.
+    """
+
+    def __init__(self):
+        self._states: Dict[Hashable, _LockState] = {}
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    async def _acquire(self, state: _LockState, exclusive: bool) -> None:
+        async with state.condition:
+            if not exclusive:
+                await state.condition.wait_for(
+                    lambda: not state.writer and not state.waiting
+                )
+                state.readers += 1
+                return
+            state.waiting += 1
+            try:
+                await state.condition.wait_for(
+                    lambda: not state.writer and not state.readers
+                )
+            finally:
+                state.waiting -= 1
+                state.condition.notify_all()
+            state.writer = True
+
+    async def _release(self, state: _LockState, exclusive: bool) -> None:
+        async with state.condition:
+            if exclusive:
+                state.writer = False
+            else:
+                state.readers -= 1
+            state.condition.notify_all()
+
+    @contextlib.asynccontextmanager
+    async def hold(self, *keys: Hashable, shared: Iterable[Hashable] = ()):
+        """
+        Hold the given keys exclusively and the `shared` keys shared.
+        """
+        wanted = {key: False for key in shared} | {key: True for key in keys}
+        order = sorted(wanted)
+        for key in order:
+            self._states.setdefault(key, _LockState()).users += 1
+        acquired: List[Hashable] = []
+        try:
+            for key in order:
+                await self._acquire(self._states[key], wanted[key])
+                acquired.append(key)
+            yield
+        finally:
+            for key in reversed(acquired):
+                await self._release(self._states[key], wanted[key])
+            for key in order:
+                state = self._states[key]
+                state.users -= 1
+                if not state.users:
+                    del self._states[key]
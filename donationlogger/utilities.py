@@ -1,9 +1,26 @@
+import bisect
+import csv
 import discord
+import io
+import json
 import noobutils as nu
 
 from redbot.core.bot import commands
 
-from typing import Dict, List, Union
+from array import array
+from typing import (
+    IO,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from .converters import AmountConverter, DLEmojiConverter
 from .exceptions import (
@@ -72,3 +89,326 @@ async def verify_amount_roles(
             except AmountConversionFailure:
                 continue
     return dict(sorted(par.items(), key=lambda b: int(b[0])))
+
+
+class DonorIndex:
+    """
+    A bank's donors kept in descending donation order.
+
+    Order entries are `(-donations, member_id)` so ties break on the lower member ID.
+    """
+
+    def __init__(self, donors: Dict[int, int] = None):
+        self.donations: Dict[int, int] = {}
+        self.order: List[Tuple[int, int]] = []
+        for member_id, amount in (donors or {}).items():
+            if amount > 0:
+                self.donations[member_id] = amount
+                self.order.append((-amount, member_id))
+        self.order.sort()
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for amount, member_id in self.order:
+            yield member_id, -amount
+
+    def set(self, member_id: int, amount: int) -> None:
+        if (previous := self.donations.pop(member_id, None)) is not None:
+            index = bisect.bisect_left(self.order, (-previous, member_id))
+            if index < len(self.order) and self.order[index] == (-previous, member_id):
+                self.order.pop(index)
+        if amount > 0:
+            self.donations[member_id] = amount
+            bisect.insort(self.order, (-amount, member_id))
+
+    def slice(self, start: int, stop: int) -> List[Tuple[int, int]]:
+        return [(member_id, -amount) for amount, member_id in self.order[start:stop]]
+
+    def count_at_least(self, amount: int) -> int:
+        """
+        The number of donors with at least this amount, they are the first ones in order.
+        """
+        return bisect.bisect_right(self.order, (-amount, float("inf")))
+
+
+class DonorPageSource:
+    """
+    A frozen range of a donor index split into pages that are built on demand.
+
+    Only the index's order references are copied, nothing is formatted up front.
+    """
+
+    def __init__(
+        self,
+        index: DonorIndex,
+        start: int,
+        stop: int,
+        reverse: bool = False,
+        per_page: int = 15,
+    ):
+        self.entries: List[Tuple[int, int]] = index.order[start:stop]
+        if reverse:
+            self.entries.reverse()
+        self.per_page = per_page
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def pages(self) -> int:
+        return max(-(-len(self.entries) // self.per_page), 1)
+
+    def page(self, number: int) -> List[Tuple[int, int, int]]:
+        """
+        `(rank, member_id, donations)` entries of a zero-based page.
+        """
+        start = number * self.per_page
+        return [
+            (rank, member_id, -amount)
+            for rank, (amount, member_id) in enumerate(
+                self.entries[start : start + self.per_page], start + 1
+            )
+        ]
+
+
+class DonorTotals(DonorIndex):
+    """
+    Combined donations of every member across a guild's visible banks.
+    """
+
+    def __init__(self, banks: Iterable[str], donors: Dict[int, int] = None):
+        super().__init__(donors)
+        self.banks: FrozenSet[str] = frozenset(banks)
+
+    def add(self, bank_name: str, member_id: int, delta: int) -> None:
+        if delta and bank_name in self.banks:
+            self.set(member_id, self.donations.get(member_id, 0) + delta)
+
+
+class AmountRoleTable:
+    """
+    A bank's amount-roles compiled into a sorted threshold array.
+    """
+
+    __slots__ = ("thresholds", "roles", "managed")
+
+    def __init__(self, roles: Dict[str, List[int]]):
+        items = sorted((int(k), v) for k, v in roles.items())
+        self.thresholds = array("q", (k for k, _ in items))
+        self.roles: List[Tuple[int, ...]] = [tuple(v) for _, v in items]
+        self.managed: FrozenSet[int] = frozenset(
+            r for roles in self.roles for r in roles
+        )
+
+    def earned(self, amount: int) -> Set[int]:
+        """
+        Role IDs of every threshold at or below the amount.
+        """
+        stop = bisect.bisect_right(self.thresholds, amount)
+        return {r for roles in self.roles[:stop] for r in roles}
+
+    def crossed(self, previous: int, updated: int) -> List[int]:
+        """
+        Role IDs whose thresholds lie between the two balances.
+
+        They should be added when the balance went up and removed when it went down,
+        roles still earned by a lower threshold are never returned for removal.
+        """
+        start = bisect.bisect_right(self.thresholds, min(previous, updated))
+        stop = bisect.bisect_right(self.thresholds, max(previous, updated))
+        crossed = {r for roles in self.roles[start:stop] for r in roles}
+        if updated < previous:
+            crossed.difference_update(r for roles in self.roles[:start] for r in roles)
+        return list(crossed)
+
+
+class LedgerPartition:
+    """
+    One day of a bank's balance changes.
+
+    Records are compact `[timestamp, member_id, delta, actor_id]` lists kept in
+    timestamp order.
+    """
+
+    def __init__(self, records: List[List[int]] = None):
+        self.records: List[List[int]] = []
+        self.timestamps: List[int] = []
+        for record in sorted(records or [], key=lambda r: r[0]):
+            self.append(record)
+
+    def append(self, record: List[int]) -> None:
+        self.records.append(record)
+        self.timestamps.append(record[0])
+
+    def totals(self, since: int, until: int) -> Dict[int, int]:
+        """
+        Net donations of every member between the two timestamps.
+        """
+        lo = bisect.bisect_left(self.timestamps, since)
+        hi = bisect.bisect_right(self.timestamps, until)
+        totals: Dict[int, int] = {}
+        for _, member_id, delta, _ in self.records[lo:hi]:
+            totals[member_id] = totals.get(member_id, 0) + delta
+        return totals
+
+
+class BalanceSnapshot:
+    """
+    A member's balances on every visible bank and their overall total, read at one version.
+    """
+
+    __slots__ = ("version", "banks", "overall")
+
+    def __init__(
+        self, version: int, banks: Tuple[Tuple[str, str, int], ...], overall: int
+    ):
+        self.version = version
+        self.banks = banks
+        self.overall = overall
+
+
+class ReconcileProgress:
+    """
+    Progress of a guild's donation role reconciliation.
+    """
+
+    __slots__ = (
+        "started",
+        "finished",
+        "scanned",
+        "total",
+        "edited",
+        "pending",
+        "added",
+        "removed",
+        "failed",
+        "status",
+    )
+
+    def __init__(self, started: int):
+        self.started: int = started
+        self.finished: Optional[int] = None
+        self.scanned = 0
+        self.total = 0
+        self.edited = 0
+        self.pending = 0
+        self.added = 0
+        self.removed = 0
+        self.failed = 0
+        self.status = "Scanning donors"
+
+
+class GuildSettings:
+    """
+    A read-only snapshot of a guild's DonationLogger settings.
+
+    Treat every attribute as immutable, the snapshot is shared by every reader until
+    the guild's settings change.
+    """
+
+    __slots__ = (
+        "setup",
+        "managers",
+        "log_channel",
+        "auto_role",
+        "banks",
+        "visible",
+        "completions",
+    )
+
+    def __init__(self, data: Dict[str, Any]):
+        self.setup: bool = data["setup"]
+        self.managers: FrozenSet[int] = frozenset(data["managers"])
+        self.log_channel: Optional[int] = data["log_channel"]
+        self.auto_role: bool = data["auto_role"]
+        self.banks: Dict[str, Dict[str, Any]] = data["banks"]
+        self.visible: Tuple[str, ...] = tuple(
+            k for k, v in self.banks.items() if not v["hidden"]
+        )
+        self.completions: Tuple[str, ...] = tuple(sorted(self.visible))
+
+    def complete(self, prefix: str, limit: int = 25) -> List[str]:
+        """
+        Visible bank names starting with the prefix, in alphabetical order.
+        """
+        prefix = prefix.strip().lower()
+        start = bisect.bisect_left(self.completions, prefix)
+        stop = bisect.bisect_left(self.completions, prefix + "\U0010ffff")
+        return list(self.completions[start : min(stop, start + limit)])
+
+
+def parse_donor_table(filename: str, raw: str) -> Tuple[Dict[int, int], List[str]]:
+    """
+    Parse a CSV (`member_id,donations`) or JSON (`{"member_id": donations}`) donor table.
+
+    Returns the parsed balances and a list of errors for rows that were skipped.
+    """
+    balances: Dict[int, int] = {}
+    failed: List[str] = []
+    is_json = filename.lower().endswith(".json") or raw.lstrip().startswith(("{", "["))
+    if is_json:
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError as e:
+            return balances, [f"Invalid JSON: {e}"]
+        if isinstance(data, list):
+            rows = [
+                (
+                    (row.get("member_id"), row.get("donations"))
+                    if isinstance(row, dict)
+                    else None
+                )
+                for row in data
+            ]
+        elif isinstance(data, dict):
+            rows = list(data.items())
+        else:
+            return balances, ["Expected a JSON object or a list of objects."]
+    else:
+        rows = csv.reader(io.StringIO(raw))
+    for line_number, row in enumerate(rows, 1):
+        if row is None:
+            failed.append(f"Row {line_number}: Expected an object.")
+            continue
+        row = ["" if field is None else str(field).strip() for field in row]
+        if not is_json:
+            while row and not row[-1]:
+                row.pop()
+            if not row or (line_number == 1 and not row[0].isdigit()):
+                continue
+        if len(row) != 2 or not all(row):
+            failed.append(f"Row {line_number}: Expected `member_id, donations`.")
+            continue
+        try:
+            member_id, amount = int(row[0]), int(row[1])
+        except ValueError:
+            failed.append(
+                f"Row {line_number}: {row[0]!r} or {row[1]!r} is not a whole number."
+            )
+            continue
+        if amount < 0 or amount > 999999999999999:
+            failed.append(
+                f"Row {line_number}: Donations must be between 0 and 999,999,999,999,999."
+            )
+            continue
+        balances[member_id] = amount
+    return balances, failed
+
+
+def write_donor_table(
+    fp: IO[bytes], donors: Iterable[Tuple[int, int]], file_format: str
+) -> None:
+    """
+    Write donors to a binary file one row at a time.
+    """
+    if file_format == "json":
+        fp.write(b"{")
+        for index, (member_id, amount) in enumerate(donors):
+            fp.write(f'{"," if index else ""}\n  "{member_id}": {amount}'.encode())
+        fp.write(b"\n}\n")
+        return
+    fp.write(b"member_id,donations\n")
+    for member_id, amount in donors:
+        fp.write(f"{member_id},{amount}\n".encode())
@@ -9,7 +9,13 @@ from redbot.core.utils import chat_formatting as cf
 from typing import Dict, List, TYPE_CHECKING, Union
 
 from .exceptions import MoreThanThreeRoles
-from .utilities import verify_amount_roles, verify_channel, verify_emoji, verify_roles
+from .utilities import (
+    DonorPageSource,
+    verify_amount_roles,
+    verify_channel,
+    verify_emoji,
+    verify_roles,
+)
 
 if TYPE_CHECKING:
     from . import DonationLogger
@@ -317,7 +323,6 @@ class DonationLoggerSetupView(discord.ui.View):
                     "hidden": False,
                     "emoji": str(self.bank["emoji"]),
                     "roles": {},
-                    "donators": {},
                 }
             }
         async with config(interaction.guild).managers() as managers:
@@ -334,6 +339,7 @@ class DonationLoggerSetupView(discord.ui.View):
                     k: [r.id for r in v] for k, v in self.amount_roles.items()
                 }
         await config(interaction.guild).setup.set(True)
+        self.cog.drop_guild_settings(interaction.guild.id)
         for x in self.children:
             x.disabled = True
         await self.message.edit(view=self)
@@ -388,41 +394,126 @@ class TotalDonoView(discord.ui.View):
     async def total_dono(
         self, interaction: discord.Interaction[Red], button: discord.ui.Button
     ):
-        final = {}
-        final_overall = []
-        async with self.cog.config.guild(interaction.guild).banks() as banks:
-            for k, v in banks.items():
-                if v["hidden"]:
-                    continue
-                donations = v["donators"].setdefault(str(self.member.id), 0)
-                final[k] = f"{v['emoji']} {cf.humanize_number(donations)}"
-                final_overall.append(donations)
-
-        overall = sum(final_overall)
+        embed = await self.cog.get_all_bank_member_dono(interaction.guild, self.member)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    async def on_timeout(self):
+        for x in self.children:
+            x.disabled = True
+        await self.message.edit(view=self)
+        self.stop()
+
+
+class DonorPagesView(discord.ui.View):
+    """
+    Paginate a donor page source, resolving members only for the page being viewed.
+    """
+
+    def __init__(
+        self,
+        source: DonorPageSource,
+        title: str,
+        empty: str,
+        timeout: float = 180.0,
+    ):
+        super().__init__(timeout=timeout)
+        self.source = source
+        self.title = title
+        self.empty = empty
+        self.current = 0
+        self.context: commands.Context = None
+        self.message: discord.Message = None
+        self.colour: discord.Colour = None
+
+    async def start(self, context: commands.Context):
+        self.context = context
+        self.colour = await context.embed_colour()
+        if self.source.pages == 1:
+            self.stop()
+            self.message = await context.send(embed=self.build_embed())
+            return
+        self.update_buttons()
+        self.message = await context.send(embed=self.build_embed(), view=self)
+
+    def build_embed(self) -> discord.Embed:
+        guild = self.context.guild
+        lines = []
+        for rank, member_id, amount in self.source.page(self.current):
+            member = guild.get_member(member_id)
+            e = "➡️ " if member_id == self.context.author.id else ""
+            lines.append(
+                f"{e}{rank}. {member.mention} (`{member_id}`): **{cf.humanize_number(amount)}**"
+                if member
+                else f"{e}{rank}. [Member not found in guild] (`{member_id}`): "
+                f"**{cf.humanize_number(amount)}**"
+            )
         embed = discord.Embed(
-            description=f"Overall combined bank donation amount: {cf.humanize_number(overall)}",
-            timestamp=discord.utils.utcnow(),
-            colour=self.member.colour,
-        )
-        embed.set_author(
-            name=f"{self.member} ({self.member.id})",
-            icon_url=nu.is_have_avatar(self.member),
+            title=self.title,
+            description="\n".join(lines or [self.empty]),
+            colour=self.colour,
         )
         embed.set_footer(
-            text=f"{interaction.guild.name} admires your donations!",
-            icon_url=nu.is_have_avatar(interaction.guild),
+            text=f"{guild.name} | Page ({self.current + 1}/{self.source.pages})",
+            icon_url=nu.is_have_avatar(guild),
         )
-        if final:
-            for k, v in final.items():
-                embed.add_field(name=k.title(), value=v, inline=True)
-        else:
-            embed.description = (
-                "There are no banks registered yet, or banks are hidden."
+        return embed
+
+    def update_buttons(self):
+        self.first_page.disabled = self.previous_page.disabled = self.current == 0
+        self.next_page.disabled = self.last_page.disabled = (
+            self.current == self.source.pages - 1
+        )
+
+    async def show_page(self, interaction: discord.Interaction[Red], page: int):
+        self.current = max(min(page, self.source.pages - 1), 0)
+        self.update_buttons()
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    @discord.ui.button(emoji="⏪", style=nu.get_button_colour("green"))
+    async def first_page(
+        self, interaction: discord.Interaction[Red], button: discord.ui.Button
+    ):
+        await self.show_page(interaction, 0)
+
+    @discord.ui.button(emoji="◀️", style=nu.get_button_colour("green"))
+    async def previous_page(
+        self, interaction: discord.Interaction[Red], button: discord.ui.Button
+    ):
+        await self.show_page(interaction, self.current - 1)
+
+    @discord.ui.button(emoji="✖️", style=nu.get_button_colour("red"))
+    async def close_pages(
+        self, interaction: discord.Interaction[Red], button: discord.ui.Button
+    ):
+        self.stop()
+        await interaction.message.delete()
+
+    @discord.ui.button(emoji="▶️", style=nu.get_button_colour("green"))
+    async def next_page(
+        self, interaction: discord.Interaction[Red], button: discord.ui.Button
+    ):
+        await self.show_page(interaction, self.current + 1)
+
+    @discord.ui.button(emoji="⏩", style=nu.get_button_colour("green"))
+    async def last_page(
+        self, interaction: discord.Interaction[Red], button: discord.ui.Button
+    ):
+        await self.show_page(interaction, self.source.pages - 1)
+
+    async def interaction_check(self, interaction: discord.Interaction[Red]) -> bool:
+        if await interaction.client.is_owner(interaction.user):
+            return True
+        elif interaction.user != self.context.author:
+            await interaction.response.send_message(
+                content=nu.access_denied(), ephemeral=True
             )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+            return False
+        else:
+            return True
 
     async def on_timeout(self):
         for x in self.children:
             x.disabled = True
-        await self.message.edit(view=self)
+        with contextlib.suppress(discord.HTTPException):
+            await self.message.edit(view=self)
         self.stop()
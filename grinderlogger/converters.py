@@ -1,3 +1,5 @@
+import datetime as dt
+
 from redbot.core.bot import commands
 
 
@@ -23,3 +25,15 @@ class AmountConverter(commands.Converter):
             raise commands.BadArgument(
                 f'Failed to convert "{argument}" into a proper amount.'
             ) from e
+
+
+class DateConverter(commands.Converter):
+    async def convert(self, ctx: commands.Context, argument: str) -> dt.datetime:
+        try:
+            return dt.datetime.strptime(argument.strip(), "%Y-%m-%d").replace(
+                tzinfo=dt.timezone.utc
+            )
+        except ValueError as e:
+            raise commands.BadArgument(
+                f'Failed to convert "{argument}" into a date, use the `YYYY-MM-DD` format.'
+            ) from e
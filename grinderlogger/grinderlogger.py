@@ -1,6 +1,9 @@
+import asyncio
 import contextlib
+import csv
 import datetime as dt
 import discord
+import io
 import noobutils as nu
 import time
 
@@ -8,9 +11,27 @@ from redbot.core.bot import commands, Red
 from redbot.core.utils import chat_formatting as cf, mod
 
 from discord.ext import tasks
-from typing import Any, Dict, List, Literal, Optional, TYPE_CHECKING, Union
-
-from .converters import AmountConverter
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+from .converters import AmountConverter, DateConverter
+from .objects import GrinderRecord
+from .utilities import (
+    GrinderLeaderboard,
+    GrinderTierTable,
+    LedgerPartition,
+    compute_grinder_report,
+)
 
 if TYPE_CHECKING:
     from donationlogger.donationlogger import DonationLogger
@@ -27,12 +48,17 @@ DEFAULT_GUILD = {
     "tiers": {"1": {}, "2": {}, "3": {}, "4": {}, "5": {}},
     "dm_status": True,
     "bank": None,
+    "escalation": {"grace": 0, "reminder": 0, "demote": 0, "remove": 0},
 }
 DEFAULT_MEMBER = {
     "donations": 0,
     "times_as_grinder": 0,
     "last_time_as_grinder": None,
 }
+ESCALATION_BATCH_SIZE = 25
+BULK_PAYMENT_LIMIT = 1000
+BULK_FILE_SIZE_LIMIT = 256 * 1024
+LEDGER_RANGE_LIMIT = 366
 
 
 class GrinderLogger(nu.Cog):
@@ -56,8 +82,21 @@ class GrinderLogger(nu.Cog):
         self.config.register_guild(**DEFAULT_GUILD)
         self.config.register_member(**DEFAULT_MEMBER)
         self.config.init_custom(group_identifier="Grinders", identifier_count=1)
+        self.config.init_custom(group_identifier="GrinderLedger", identifier_count=2)
+        self.config.register_custom("GrinderLedger", entries=[])
+        self.config.register_user(ledger=[])
         self.init_done = False
-        self.data: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.data: Dict[int, Dict[int, GrinderRecord]] = {}
+        self.member_guilds: Dict[int, Set[int]] = {}
+        self.leaderboard_cache: Dict[int, GrinderLeaderboard] = {}
+        self.ledger_cache: Dict[Tuple[int, str], LedgerPartition] = {}
+        self.ledger_locks: Dict[int, asyncio.Lock] = {}
+        self.ledger_index_lock = asyncio.Lock()
+        self.ledger_indexed: Dict[Tuple[int, int], str] = {}
+        self.manager_cache: Dict[int, FrozenSet[int]] = {}
+        self.non_manager_cache: Dict[int, Dict[int, FrozenSet[int]]] = {}
+        self.escalation_cache: Dict[int, Dict[str, int]] = {}
+        self.tier_cache: Dict[int, GrinderTierTable] = {}
 
     async def red_delete_data_for_user(
         self,
@@ -68,17 +107,32 @@ class GrinderLogger(nu.Cog):
         """
         This cog stores user ID for grinder logs. Users can remove their data at anytime.
         """
-        for guild_id, grinder_data in self.data.copy().items():
-            if grinder_data:
-                for member_id in grinder_data.keys():
-                    if user_id == int(member_id):
-                        if self.data.get(guild_id, {}).get(member_id):
-                            self.data[guild_id].pop(member_id)
-                        await self.config.member_from_ids(
-                            int(guild_id), int(member_id)
-                        ).clear()
-
-        await self.back_to_config()
+        for guild_id in self.member_guilds.pop(user_id, set()):
+            self.data.get(guild_id, {}).pop(user_id, None)
+            if lb := self.leaderboard_cache.get(guild_id):
+                lb.remove(user_id)
+            await self.config.member_from_ids(guild_id, user_id).clear()
+            await self.save_guild(guild_id)
+
+        async with self.ledger_index_lock:
+            partitions = await self.config.user_from_id(user_id).ledger()
+            await self.config.user_from_id(user_id).clear()
+            for key in [k for k in self.ledger_indexed if k[0] == user_id]:
+                del self.ledger_indexed[key]
+        for guild_id, day in partitions:
+            async with self.ledger_locks.setdefault(guild_id, asyncio.Lock()):
+                group = self.config.custom("GrinderLedger", str(guild_id), day)
+                entries = [
+                    [*r[:4], 0] if r[4] == user_id else r
+                    for r in await group.entries()
+                    if r[1] != user_id
+                ]
+                if entries:
+                    await group.entries.set(entries)
+                    self.ledger_cache[(guild_id, day)] = LedgerPartition(entries)
+                else:
+                    await group.clear()
+                    self.ledger_cache.pop((guild_id, day), None)
 
     async def cog_load(self):
         self.bot.add_dev_env_value("grinderlogger", lambda _: self)
@@ -87,7 +141,18 @@ class GrinderLogger(nu.Cog):
 
         if data := (await self.config.custom("Grinders").all()).copy():
             before_time = time.perf_counter()
-            self.data = data
+            self.data = {
+                int(guild_id): {
+                    int(member_id): GrinderRecord.from_dict(
+                        int(guild_id), int(member_id), member_data
+                    )
+                    for member_id, member_data in grinder_data.items()
+                }
+                for guild_id, grinder_data in data.items()
+            }
+            for guild_id, grinder_data in self.data.items():
+                for member_id in grinder_data:
+                    self.member_guilds.setdefault(member_id, set()).add(guild_id)
             after_time = time.perf_counter()
             self.log.info(
                 f"GrinderLogger data initialized in {round(after_time - before_time, 3)}s."
@@ -108,16 +173,255 @@ class GrinderLogger(nu.Cog):
 
     async def back_to_config(self):
         old_data = (await self.config.custom("Grinders").all()).copy()
-        old_data.update(self.data)
+        old_data.update(
+            {
+                str(guild_id): {
+                    str(member_id): record.to_dict()
+                    for member_id, record in grinder_data.items()
+                }
+                for guild_id, grinder_data in self.data.items()
+            }
+        )
         await self.config.custom("Grinders").set(old_data)
 
-    def add_to_data(self, guild_id: str, member_id: str, member_data: dict):
-        self.data.setdefault(guild_id, {})
-        self.data[guild_id].update({member_id: member_data})
+    async def save_guild(self, guild_id: int):
+        await self.config.custom("Grinders", str(guild_id)).set(
+            {
+                str(member_id): record.to_dict()
+                for member_id, record in self.data.get(guild_id, {}).items()
+            }
+        )
+
+    async def get_managers(self, guild: discord.Guild) -> FrozenSet[int]:
+        if (managers := self.manager_cache.get(guild.id)) is None:
+            managers = frozenset(await self.config.guild(guild).managers())
+            self.manager_cache[guild.id] = managers
+        return managers
+
+    async def is_mod_or_superior(self, member: discord.Member) -> bool:
+        """
+        Red's mod check, remembering members that failed it until their roles change.
+        """
+        non_managers = self.non_manager_cache.setdefault(member.guild.id, {})
+        roles = frozenset(member._roles)
+        if non_managers.get(member.id) == roles:
+            return False
+        if await mod.is_mod_or_superior(self.bot, member):
+            non_managers.pop(member.id, None)
+            return True
+        non_managers[member.id] = roles
+        return False
+
+    async def get_tier_table(self, guild_id: int) -> GrinderTierTable:
+        if (table := self.tier_cache.get(guild_id)) is None:
+            table = GrinderTierTable(await self.config.guild_from_id(guild_id).tiers())
+            self.tier_cache[guild_id] = table
+        return table
+
+    async def get_escalation(self, guild_id: int) -> Dict[str, int]:
+        if (policy := self.escalation_cache.get(guild_id)) is None:
+            policy = await self.config.guild_from_id(guild_id).escalation()
+            self.escalation_cache[guild_id] = policy
+        return policy
+
+    async def next_escalation(self, record: GrinderRecord, now: int) -> Optional[str]:
+        if not record.due_timestamp or record.due_timestamp >= now:
+            return None
+        policy = await self.get_escalation(record.guild_id)
+        overdue = now - record.due_timestamp - policy["grace"] * 86400
+        if overdue < 0:
+            return None
+        if policy["remove"] and overdue >= policy["remove"] * 86400:
+            return "remove"
+        if policy["demote"] and record.demotions < overdue // (
+            policy["demote"] * 86400
+        ):
+            return "demote"
+        if not record.reminded:
+            return "remind"
+        if (
+            policy["reminder"]
+            and now - (record.last_reminded or record.due_timestamp)
+            >= policy["reminder"] * 86400
+        ):
+            return "remind"
+        return None
+
+    def get_grinder(self, guild_id: int, member_id: int) -> Optional[GrinderRecord]:
+        return self.data.get(guild_id, {}).get(member_id)
+
+    def add_to_data(self, record: GrinderRecord):
+        self.data.setdefault(record.guild_id, {})
+        self.data[record.guild_id][record.member_id] = record
+        self.member_guilds.setdefault(record.member_id, set()).add(record.guild_id)
 
-    def remove_from_data(self, guild_id: str, member_id: str):
+    def remove_from_data(self, guild_id: int, member_id: int):
         with contextlib.suppress(KeyError):
             self.data[guild_id].pop(member_id)
+        if guilds := self.member_guilds.get(member_id):
+            guilds.discard(guild_id)
+            if not guilds:
+                del self.member_guilds[member_id]
+
+    async def get_leaderboard(self, guild: discord.Guild) -> GrinderLeaderboard:
+        if (lb := self.leaderboard_cache.get(guild.id)) is not None:
+            return lb
+        lb = GrinderLeaderboard()
+        all_members = await self.config.all_members(guild)
+        for mid, record in self.data.get(guild.id, {}).copy().items():
+            lb.upsert(
+                mid,
+                all_members.get(mid, {}).get("donations", 0),
+                record.due_timestamp,
+                record.tier,
+            )
+        return self.leaderboard_cache.setdefault(guild.id, lb)
+
+    async def update_leaderboard(
+        self, guild: discord.Guild, member_id: int, donations: int = None
+    ):
+        if (lb := self.leaderboard_cache.get(guild.id)) is None:
+            return
+        record = self.get_grinder(guild.id, member_id)
+        if not record:
+            return lb.remove(member_id)
+        if donations is None:
+            donations = await self.config.member_from_ids(
+                guild.id, member_id
+            ).donations()
+        lb.upsert(member_id, donations, record.due_timestamp, record.tier)
+
+    @staticmethod
+    def ledger_days(since: dt.datetime, until: dt.datetime) -> List[str]:
+        days = []
+        day = since.date()
+        while day <= until.date():
+            days.append(day.isoformat())
+            day += dt.timedelta(days=1)
+        return days
+
+    async def get_ledger_partition(self, guild_id: int, day: str) -> LedgerPartition:
+        """
+        One day of a guild's ledger, empty days are read again instead of being cached.
+        """
+        if (partition := self.ledger_cache.get((guild_id, day))) is None:
+            entries = await self.config.custom(
+                "GrinderLedger", str(guild_id), day
+            ).entries()
+            partition = LedgerPartition(entries)
+            if entries:
+                # A concurrent load may have cached and appended to it meanwhile.
+                partition = self.ledger_cache.setdefault((guild_id, day), partition)
+        return partition
+
+    async def log_payments(
+        self, context: commands.Context, payments: List[Tuple[int, int, int]]
+    ):
+        """
+        Append `(member_id, amount, tier)` payments to today's ledger partition.
+        """
+        now = dt.datetime.now(dt.timezone.utc)
+        day = now.date().isoformat()
+        records = [
+            [round(now.timestamp()), member_id, amount, tier, context.author.id]
+            for member_id, amount, tier in payments
+        ]
+        async with self.ledger_locks.setdefault(context.guild.id, asyncio.Lock()):
+            partition = await self.get_ledger_partition(context.guild.id, day)
+            async with self.config.custom(
+                "GrinderLedger", str(context.guild.id), day
+            ).entries() as entries:
+                entries.extend(records)
+            for record in records:
+                partition.append(record)
+            await self.index_ledger_users(
+                context.guild.id,
+                day,
+                {member_id for member_id, _, _ in payments} | {context.author.id},
+            )
+
+    async def index_ledger_users(self, guild_id: int, day: str, user_ids: Set[int]):
+        """
+        Add a ledger partition to the persisted partitions of each user in it.
+        """
+        user_ids = {
+            u for u in user_ids if self.ledger_indexed.get((u, guild_id)) != day
+        }
+        if not user_ids:
+            return
+        async with self.ledger_index_lock:
+            for user_id in user_ids:
+                async with self.config.user_from_id(user_id).ledger() as ledger:
+                    if [guild_id, day] not in ledger:
+                        ledger.append([guild_id, day])
+                self.ledger_indexed[(user_id, guild_id)] = day
+
+    async def query_ledger(
+        self,
+        guild: discord.Guild,
+        since: dt.datetime,
+        until: dt.datetime,
+        member_id: int = None,
+        tier: int = None,
+    ) -> List[List[int]]:
+        results = []
+        for day in self.ledger_days(since, until):
+            partition = await self.get_ledger_partition(guild.id, day)
+            results.extend(
+                partition.query(
+                    round(since.timestamp()), round(until.timestamp()), member_id, tier
+                )
+            )
+        return results
+
+    async def send_ledger_history(
+        self,
+        context: commands.Context,
+        title: str,
+        since: Optional[dt.datetime],
+        until: Optional[dt.datetime],
+        member_id: int = None,
+        tier: int = None,
+    ):
+        # A given end date counts up to the last second of that day.
+        end = (
+            until + dt.timedelta(days=1, seconds=-1)
+            if until
+            else dt.datetime.now(dt.timezone.utc)
+        )
+        until = until or end
+        since = since or until - dt.timedelta(days=30)
+        if since > until:
+            return await context.send(
+                content="The start date must be before the end date."
+            )
+        if (until - since).days >= LEDGER_RANGE_LIMIT:
+            return await context.send(
+                content=f"The range can span at most {LEDGER_RANGE_LIMIT} days."
+            )
+        records = await self.query_ledger(context.guild, since, end, member_id, tier)
+        if not records:
+            return await context.send(
+                content="No grinder payments were logged in that range."
+            )
+        total = sum(record[2] for record in records)
+        lines = [
+            f"<t:{ts}:d> <@{mid}> (`{mid}`): **{'+' if amt > 0 else '-'}"
+            f"{cf.humanize_number(abs(amt))}** (Tier {t})"
+            + (f" by <@{aid}>" if aid else "")
+            for ts, mid, amt, t, aid in reversed(records)
+        ]
+        pagified = await nu.pagify_this(
+            f"Payments: **{cf.humanize_number(len(records))}**\n"
+            f"Net amount: **{cf.humanize_number(total)}**\n"
+            f"Range: <t:{round(since.timestamp())}:d> - <t:{round(until.timestamp())}:d>\n\n"
+            + "\n".join(lines),
+            "\n",
+            embed_title=title,
+            embed_timestamp=dt.datetime.now(dt.timezone.utc),
+            embed_colour=await context.embed_colour(),
+        )
+        await nu.NoobPaginator(pagified).start(context)
 
     async def add_or_remove_grinder_roles(
         self, _type: str, member: discord.Member, roles: list, reason: str
@@ -186,31 +490,38 @@ class GrinderLogger(nu.Cog):
         ):
             await member.send(embed=embed)
 
-    async def remind_member(self, guild: discord.Guild, member_id: str):
-        tiers = await self.config.guild(guild).tiers()
-        managers = await self.config.guild(guild).managers()
+    async def remind_member(self, guild: discord.Guild, record: GrinderRecord):
+        tiers = await self.get_tier_table(guild.id)
+        managers = await self.get_managers(guild)
         channels = await self.config.guild(guild).channels()
-        mem = guild.get_member(int(member_id))
+        member_id = record.member_id
+        mem = guild.get_member(member_id)
         if mem:
             c = mem.colour
             av = nu.is_have_avatar(mem)
         else:
             c = self.bot._color
             av = None
-        member_data = self.data[str(guild.id)][member_id]
-        member_data["reminded"] = True
-        await self.back_to_config()
-        tier = member_data.get("tier")
+        record.reminded = True
+        record.reminders += 1
+        record.last_reminded = round(dt.datetime.now(dt.timezone.utc).timestamp())
+        tier = str(record.tier)
         man_roles: List[discord.Role] = []
         for rid in managers:
             if role := guild.get_role(rid):
                 man_roles.append(role)
-        try:
-            at = f"**{tier}** ({cf.humanize_number(tiers[tier]['amount'])}/day)"
-        except KeyError:
+        if record.tier in tiers:
+            at = f"**{tier}** ({cf.humanize_number(tiers.amount(record.tier))}/day)"
+        else:
             at = "It seems this tier is not defined please report this to the admins."
         ada = round(dt.datetime.now(dt.timezone.utc).timestamp())
         ad = f"<t:{ada}:R> (<t:{ada}:D>)"
+        esc = (
+            f"\n⚠️ `Reminder #{record.reminders}`: This payment has been due since "
+            f"<t:{record.due_timestamp}:R>."
+            if record.reminders > 1
+            else ""
+        )
 
         dms_off = []
         try:
@@ -221,7 +532,7 @@ class GrinderLogger(nu.Cog):
                     "- Please ensure your payment is made promptly to maintain your grinder status in "
                     f"**{guild.name}**.\n\n__**Details**__\n- `{'Tier':<4}`: {at}\n"
                     f"- `{'Date':<4}`: {ad}\n\n"
-                    "⚠️ `Note`: Feel free to pay early!"
+                    f"⚠️ `Note`: Feel free to pay early!{esc}"
                 ),
                 timestamp=dt.datetime.now(dt.timezone.utc),
                 colour=c,
@@ -233,7 +544,7 @@ class GrinderLogger(nu.Cog):
             dms_off.append(True)
         if not channels["notifying"]:
             return
-        
+
         notifchan = guild.get_channel_or_thread(channels["notifying"])
         with contextlib.suppress(
             (discord.errors.Forbidden, discord.errors.HTTPException)
@@ -251,7 +562,7 @@ class GrinderLogger(nu.Cog):
                     "- Please verify their payment status, **update** the grinder log, "
                     "and ensure their status remains intact.\n\n__**Payment Details**__\n"
                     f"- `{'Member':<6}`: <@{member_id}>\n- `{'Tier':<6}`: {at}\n"
-                    f"- `{'Date':<6}`: {ad}\n\nThanks for your attention!\n{warn}"
+                    f"- `{'Date':<6}`: {ad}{esc}\n\nThanks for your attention!\n{warn}"
                 ),
                 timestamp=dt.datetime.now(dt.timezone.utc),
             )
@@ -264,6 +575,107 @@ class GrinderLogger(nu.Cog):
                     allowed_mentions=discord.AllowedMentions(roles=man_roles),
                 )
 
+    async def log_escalation(
+        self, guild: discord.Guild, member_id: int, title: str, description: str
+    ):
+        chan = await self.config.guild(guild).channels.history()
+        if not chan or not (hchan := guild.get_channel_or_thread(chan)):
+            return
+        member = guild.get_member(member_id)
+        embed = discord.Embed(
+            title=title,
+            description=description,
+            colour=member.colour if member else self.bot._color,
+            timestamp=dt.datetime.now(dt.timezone.utc),
+        )
+        embed.set_footer(
+            text=f"Automated by the escalation policy | {guild.name}",
+            icon_url=nu.is_have_avatar(guild),
+        )
+        if member:
+            embed.set_thumbnail(url=nu.is_have_avatar(member))
+            embed.set_author(
+                name=f"{member.name} ({member.id})", icon_url=nu.is_have_avatar(member)
+            )
+        with contextlib.suppress(discord.errors.HTTPException):
+            await hchan.send(embed=embed)
+
+    async def auto_demote_grinder(self, guild: discord.Guild, record: GrinderRecord):
+        tiers = await self.get_tier_table(guild.id)
+        record.demotions += 1
+        lower = tiers.next_lower(record.tier)
+        if lower is None:
+            return
+        before, record.tier = record.tier, lower
+        await self.update_leaderboard(guild, record.member_id)
+        reason = f"Automatically demoted to a Tier {lower} grinder for being overdue on payments."
+        removed_roles = []
+        if member := guild.get_member(record.member_id):
+            roles = tiers.roles_between(lower + 1, before)
+            with contextlib.suppress(discord.errors.HTTPException):
+                removed_roles = await self.add_or_remove_grinder_roles(
+                    "remove", member, roles, reason
+                )
+            if await self.config.guild(guild).dm_status():
+                await self.dm_on_promote_or_demote(
+                    member,
+                    "demote",
+                    removed_roles,
+                    tiers.amount(lower),
+                    str(before),
+                    str(lower),
+                    reason,
+                )
+        await self.log_escalation(
+            guild,
+            record.member_id,
+            "__GRINDER AUTO DEMOTION__",
+            f"- A grinder has been **automatically demoted** for being overdue.\n\n"
+            f"__**Details:**__\n- `{'Member':<9}`: <@{record.member_id}> (`{record.member_id}`)\n"
+            f"- `{'From Tier':<9}`: **{before}**\n- `{'To Tier':<9}`: **{lower}** "
+            f"({cf.humanize_number(tiers.amount(lower))}/day) ⬇️\n"
+            f"- `{'Due Date':<9}`: <t:{record.due_timestamp}:R> (<t:{record.due_timestamp}:F>)",
+        )
+
+    async def auto_remove_grinder(self, guild: discord.Guild, record: GrinderRecord):
+        tiers = await self.get_tier_table(guild.id)
+        now = round(dt.datetime.now(dt.timezone.utc).timestamp())
+        tier = str(record.tier)
+        self.remove_from_data(guild.id, record.member_id)
+        await self.update_leaderboard(guild, record.member_id)
+        await self.config.member_from_ids(
+            guild.id, record.member_id
+        ).last_time_as_grinder.set(now)
+        reason = (
+            "Automatically removed from the grinders for being overdue on payments."
+        )
+        if member := guild.get_member(record.member_id):
+            roles = tiers.roles_between(1, record.tier)
+            removed_roles = []
+            with contextlib.suppress(discord.errors.HTTPException):
+                removed_roles = await self.add_or_remove_grinder_roles(
+                    "remove", member, roles, reason
+                )
+            await self.dm_grinder(
+                guild,
+                member,
+                tiers.amount(record.tier),
+                removed_roles,
+                tier,
+                "removed",
+                reason,
+            )
+        await self.log_escalation(
+            guild,
+            record.member_id,
+            "**__GRINDER AUTO REMOVED__**",
+            f"- A grinder has been **automatically removed** for being overdue.\n\n"
+            f"__**Details:**__\n- `{'Member':<11}`: <@{record.member_id}> (`{record.member_id}`)\n"
+            f"- `{'Tier':<11}`: **{tier}**\n"
+            f"- `{'Due Date':<11}`: <t:{record.due_timestamp}:R> (<t:{record.due_timestamp}:F>)\n"
+            f"- `{'Grinder For':<11}`: **{cf.humanize_timedelta(seconds=now - record.grinder_since)}**",
+        )
+
     async def log_grinder_history(
         self,
         context: commands.Context,
@@ -430,7 +842,7 @@ class GrinderLogger(nu.Cog):
         if not logchan:
             return
         lchan = context.guild.get_channel_or_thread(logchan)
-        tier = self.data[str(context.guild.id)][str(member.id)]["tier"]
+        tier = self.data[context.guild.id][member.id].tier
         view = discord.ui.View().add_item(
             discord.ui.Button(label="Jump To Command", url=context.message.jump_url)
         )
@@ -448,8 +860,6 @@ class GrinderLogger(nu.Cog):
         embed.add_field(
             name="After Balance:", value=cf.humanize_number(a_amount), inline=True
         )
-        if note:
-            embed.add_field(name="Note:", value=note, inline=False)
         if due_time:
             embed.add_field(
                 name="Due Date:",
@@ -487,27 +897,29 @@ class GrinderLogger(nu.Cog):
 
         if member.bot:
             return await context.send(content="Bots are not allowed.")
-        if guild := self.data.get(str(context.guild.id), {}):
-            if member_data := guild.get(str(member.id)):
+        if guild := self.data.get(context.guild.id, {}):
+            if record := guild.get(member.id):
                 if due_duration:
                     dat = (
-                        dt.datetime.fromtimestamp(
-                            member_data["due_timestamp"], dt.timezone.utc
-                        )
-                        if member_data["due_timestamp"]
+                        dt.datetime.fromtimestamp(record.due_timestamp, dt.timezone.utc)
+                        if record.due_timestamp
                         else dt.datetime.now(dt.timezone.utc)
                     )
                     stamp = dat + due_duration
-                    member_data["due_timestamp"] = round(stamp.timestamp())
-                if member_data["reminded"]:
-                    member_data["reminded"] = False
+                    record.due_timestamp = round(stamp.timestamp())
+                if record.due_timestamp and record.due_timestamp > round(
+                    dt.datetime.now(dt.timezone.utc).timestamp()
+                ):
+                    record.reset_escalation()
+                elif record.reminded:
+                    record.reminded = False
                 before = await self.config.member(member).donations()
                 after = before + amount
                 await self.config.member(member).donations.set(after)
-                member_data["last_payed"] = round(
-                    dt.datetime.now(dt.timezone.utc).timestamp()
-                )
-                await self.back_to_config()
+                record.last_payed = round(dt.datetime.now(dt.timezone.utc).timestamp())
+                await self.save_guild(context.guild.id)
+                await self.update_leaderboard(context.guild, member.id, after)
+                await self.log_payments(context, [(member.id, amount, record.tier)])
                 await context.tick()
                 await self.send_to_log_channel(
                     context,
@@ -516,23 +928,22 @@ class GrinderLogger(nu.Cog):
                     after,
                     amount,
                     "added",
-                    member_data["due_timestamp"],
+                    record.due_timestamp,
                     note,
                 )
-                if bank and context.bot.get_cog("DonationLogger"):
-                    if cmd := self.bot.get_command("donationlogger add"):
-                        n = (
-                            f"`From GrinderLogger`: {note}"
-                            if note
-                            else "From GrinderLogger."
-                        )
-                        await context.invoke(
-                            cmd,
-                            bank_name=bank,
-                            amount=amount,
-                            member=member,
-                            note=n,
-                        )
+                cog: "DonationLogger" = context.bot.get_cog("DonationLogger")
+                if bank and cog:
+                    if balances := await cog.bank_credit(
+                        context.guild,
+                        bank,
+                        member.id,
+                        amount,
+                        actor_id=context.author.id,
+                    ):
+                        with contextlib.suppress(discord.HTTPException):
+                            await cog.update_dono_roles(
+                                context, bank, *balances, member
+                            )
             else:
                 await context.send(content="This member is not a grinder.")
         else:
@@ -552,26 +963,30 @@ class GrinderLogger(nu.Cog):
         if member.bot:
             return await context.send(content="Bots are not allowed.")
         bank = await self.config.guild(context.guild).bank()
-        if guild := self.data.get(str(context.guild.id), {}):
-            if member_data := guild.get(str(member.id)):
+        if guild := self.data.get(context.guild.id, {}):
+            if record := guild.get(member.id):
                 before = await self.config.member(member).donations()
                 if before == 0:
                     return await context.send(
                         content="This grinder has 0 donation amount."
                     )
-                if time_to_remove and member_data["due_timestamp"]:
+                if time_to_remove and record.due_timestamp:
                     due_date = dt.datetime.fromtimestamp(
-                        member_data.get("due_timestamp"), dt.timezone.utc
+                        record.due_timestamp, dt.timezone.utc
                     )
                     new_date = due_date - time_to_remove
                     if new_date < dt.datetime.now(dt.timezone.utc):
-                        member_data["due_timestamp"] = round(new_date.timestamp())
-                        member_data["reminded"] = True
+                        record.due_timestamp = round(new_date.timestamp())
+                        record.reminded = True
                     else:
-                        member_data["due_timestamp"] = round(new_date.timestamp())
+                        record.due_timestamp = round(new_date.timestamp())
                 after = max(before - amount, 0)
                 await self.config.member(member).donations.set(after)
-                await self.back_to_config()
+                await self.save_guild(context.guild.id)
+                await self.update_leaderboard(context.guild, member.id, after)
+                await self.log_payments(
+                    context, [(member.id, after - before, record.tier)]
+                )
                 await context.tick()
                 await self.send_to_log_channel(
                     context,
@@ -580,56 +995,198 @@ class GrinderLogger(nu.Cog):
                     after,
                     amount,
                     "removed",
-                    member_data["due_timestamp"],
+                    record.due_timestamp,
                     note,
                 )
-                if bank and context.bot.get_cog("DonationLogger"):
-                    if cmd := self.bot.get_command("donationlogger remove"):
-                        n = (
-                            f"`From GrinderLogger`: {note}"
-                            if note
-                            else "From GrinderLogger."
-                        )
-                        await context.invoke(
-                            cmd,
-                            bank_name=bank,
-                            amount=amount,
-                            member=member,
-                            note=n,
-                        )
+                cog: "DonationLogger" = context.bot.get_cog("DonationLogger")
+                if bank and cog:
+                    if balances := await cog.bank_debit(
+                        context.guild,
+                        bank,
+                        member.id,
+                        amount,
+                        actor_id=context.author.id,
+                    ):
+                        with contextlib.suppress(discord.HTTPException):
+                            await cog.update_dono_roles(
+                                context, bank, *balances, member
+                            )
             else:
                 await context.send(content="This member is not a grinder.")
         else:
             await context.send(content="This guild has no grinders.")
 
+    @staticmethod
+    def read_bulk_rows(raw: str) -> List[Tuple[int, List[str]]]:
+        """
+        Split bulk payments into `(line_number, fields)` rows, skipping blanks and the header.
+
+        Trailing empty fields are dropped, empty fields in between are kept so the row fails.
+        """
+        rows = []
+        for line_number, row in enumerate(csv.reader(io.StringIO(raw)), 1):
+            row = [field.strip() for field in row]
+            while row and not row[-1]:
+                row.pop()
+            if not row or (line_number == 1 and row[0].lower() == "member"):
+                continue
+            rows.append((line_number, row))
+        return rows
+
+    async def parse_bulk_payments(
+        self, context: commands.Context, rows: List[Tuple[int, List[str]]]
+    ) -> Tuple[List[Tuple[discord.Member, int, Optional[dt.timedelta]]], List[str]]:
+        payments = []
+        failed = []
+        for line_number, row in rows:
+            if len(row) not in (2, 3) or not all(row):
+                failed.append(f"Line {line_number}: Expected `member, amount[, time]`.")
+                continue
+            try:
+                member = await commands.MemberConverter().convert(context, row[0])
+                amount = await AmountConverter().convert(context, row[1])
+                duration = (
+                    await commands.TimedeltaConverter().convert(context, row[2])
+                    if len(row) == 3
+                    else None
+                )
+            except commands.BadArgument as e:
+                failed.append(f"Line {line_number}: {e}")
+                continue
+            if not self.get_grinder(context.guild.id, member.id):
+                failed.append(f"Line {line_number}: {member.name} is not a grinder.")
+                continue
+            payments.append((member, amount, duration))
+        return payments, failed
+
+    async def bulk_donoadd(
+        self,
+        context: commands.Context,
+        payments: List[Tuple[discord.Member, int, Optional[dt.timedelta]]],
+    ) -> List[Tuple[discord.Member, int, int, Optional[int]]]:
+        """
+        Add many grinder donations, reading every member's donations once.
+        """
+        guild_data = self.data[context.guild.id]
+        now = dt.datetime.now(dt.timezone.utc)
+        results = []
+        all_members = await self.config.all_members(context.guild)
+        donations: Dict[int, int] = {}
+        for member, amount, due_duration in payments:
+            record = guild_data[member.id]
+            if due_duration:
+                dat = (
+                    dt.datetime.fromtimestamp(record.due_timestamp, dt.timezone.utc)
+                    if record.due_timestamp
+                    else now
+                )
+                stamp = dat + due_duration
+                record.due_timestamp = round(stamp.timestamp())
+            if record.due_timestamp and record.due_timestamp > now.timestamp():
+                record.reset_escalation()
+            else:
+                record.reminded = False
+            record.last_payed = round(now.timestamp())
+            before = donations.get(
+                member.id,
+                all_members.get(member.id, {}).get(
+                    "donations", DEFAULT_MEMBER["donations"]
+                ),
+            )
+            donations[member.id] = before + amount
+            results.append((member, before, before + amount, record.due_timestamp))
+        for member_id, amount in donations.items():
+            await self.config.member_from_ids(
+                context.guild.id, member_id
+            ).donations.set(amount)
+        await self.save_guild(context.guild.id)
+        for member, _, after, _ in results:
+            await self.update_leaderboard(context.guild, member.id, after)
+        await self.log_payments(
+            context,
+            [
+                (member.id, after - before, guild_data[member.id].tier)
+                for member, before, after, _ in results
+            ],
+        )
+
+        bank = await self.config.guild(context.guild).bank()
+        cog: "DonationLogger" = context.bot.get_cog("DonationLogger")
+        if bank and cog:
+            amounts: Dict[int, int] = {}
+            for member, before, after, _ in results:
+                amounts[member.id] = amounts.get(member.id, 0) + after - before
+            balances = await cog.bank_credit_many(
+                context.guild, bank, amounts, actor_id=context.author.id
+            )
+            await cog.add_dono_roles_many(
+                context,
+                bank,
+                list({m.id: m for m, _, _, _ in results if m.id in balances}.values()),
+                balances,
+                (await cog.get_guild_settings(context.guild.id)).auto_role,
+            )
+        await self.send_bulk_to_log_channel(context, results)
+        return results
+
+    async def send_bulk_to_log_channel(
+        self,
+        context: commands.Context,
+        results: List[Tuple[discord.Member, int, int, Optional[int]]],
+    ):
+        logchan = await self.config.guild(context.guild).channels.logging()
+        if not logchan:
+            return
+        lchan = context.guild.get_channel_or_thread(logchan)
+        lines = [
+            f"- {member.mention} (`{member.id}`): +{cf.humanize_number(after - before)} "
+            f"({cf.humanize_number(before)} ➜ {cf.humanize_number(after)})"
+            + (f" due <t:{due}:R>" if due else "")
+            for member, before, after, due in results
+        ]
+        description = ""
+        for index, line in enumerate(lines):
+            if len(description) + len(line) > 3800:
+                description += f"...and {len(lines) - index} more."
+                break
+            description += f"{line}\n"
+        view = discord.ui.View().add_item(
+            discord.ui.Button(label="Jump To Command", url=context.message.jump_url)
+        )
+        embed = discord.Embed(
+            title="__Grinder Bulk Payments Added__",
+            description=description,
+            timestamp=dt.datetime.now(dt.timezone.utc),
+            colour=await context.embed_colour(),
+        )
+        embed.add_field(name="Payments:", value=cf.humanize_number(len(results)))
+        embed.add_field(
+            name="Total Amount:",
+            value=cf.humanize_number(sum(a - b for _, b, a, _ in results)),
+        )
+        embed.set_footer(
+            text=f"Authorized by: {context.author} ({context.author.id})",
+            icon_url=nu.is_have_avatar(context.author),
+        )
+        try:
+            await lchan.send(embed=embed, view=view)
+        except Exception:
+            await context.send(
+                content="⚠️ Log channel not found.", embed=embed, view=view
+            )
+
     async def lb_whatever(
         self,
         guild: discord.Guild,
-        sort_by: str,
-        all_m: Dict[Union[discord.Member, int], Dict[str, Any]],
+        sorted_members: List[Tuple[int, Dict[str, Any]]],
     ) -> List[str]:
-        tiers = await self.config.guild(guild).tiers()
+        tiers = await self.get_tier_table(guild.id)
         all_mem = []
-        if sort_by == "dono":
-            k = lambda x: x[1]["donations"]
-        elif sort_by == "due":
-
-            def check(x):
-                d = x[1]["due"]
-                if d is None:
-                    d = 0
-                return d
-
-            k = check
-        else:
-            k = lambda x: int(x[1]["tier"])
-
-        for index, (mem, mem_dono) in enumerate(
-            sorted(all_m.items(), key=k, reverse=True), 1
-        ):
-            amt = tiers[mem_dono["tier"]]["amount"]
+        for index, (mid, mem_dono) in enumerate(sorted_members, 1):
+            mem = guild.get_member(mid) or mid
+            amt = tiers.amount(mem_dono["tier"])
+            t = f"{mem_dono['tier']} ({cf.humanize_number(amt)}/day)"
             if isinstance(mem, discord.Member):
-                t = f"{mem_dono['tier']} ({cf.humanize_number(amt)}/day)"
                 msg = (
                     f"` {index}. ` {mem.mention} (`{mem.id}`):\n"
                     f"> - `{f'Tier':<9}`: **{t}**\n"
@@ -650,24 +1207,31 @@ class GrinderLogger(nu.Cog):
     async def due_reminder_loop(self):
         if not self.init_done:
             return
+        now = round(dt.datetime.now(dt.timezone.utc).timestamp())
+        batch: List[Tuple[discord.Guild, GrinderRecord, str]] = []
         for guild_id, grinder_data in self.data.copy().items():
-            if guild := self.bot.get_guild(int(guild_id)):
-                for member_id in grinder_data.keys():
-                    if member_data := self.data.get(guild_id, {}).get(member_id):
-                        if (
-                            not member_data["reminded"]
-                            and member_data["due_timestamp"]
-                            and (
-                                dt.datetime.fromtimestamp(
-                                    member_data["due_timestamp"], dt.timezone.utc
-                                )
-                                < dt.datetime.now(dt.timezone.utc)
-                            )
-                        ):
-                            try:
-                                await self.remind_member(guild, member_id)
-                            except Exception as e:
-                                self.log.exception(str(e), exc_info=e)
+            if len(batch) >= ESCALATION_BATCH_SIZE:
+                break
+            if guild := self.bot.get_guild(guild_id):
+                for record in list(grinder_data.values()):
+                    if action := await self.next_escalation(record, now):
+                        batch.append((guild, record, action))
+                        if len(batch) >= ESCALATION_BATCH_SIZE:
+                            break
+        if not batch:
+            return
+        for guild, record, action in batch:
+            try:
+                if action == "remove":
+                    await self.auto_remove_grinder(guild, record)
+                elif action == "demote":
+                    await self.auto_demote_grinder(guild, record)
+                else:
+                    await self.remind_member(guild, record)
+            except Exception as e:
+                self.log.exception(str(e), exc_info=e)
+        for guild_id in {guild.id for guild, _, _ in batch}:
+            await self.save_guild(guild_id)
 
     @tasks.loop(minutes=5)
     async def save_data_to_config(self):
@@ -691,11 +1255,10 @@ class GrinderLogger(nu.Cog):
             return (
                 context.author.guild_permissions.manage_guild
                 or context.author.guild_permissions.administrator
-                or await mod.is_mod_or_superior(context.bot, context.author)
-                or any(
-                    role_id in context.author._roles
-                    for role_id in await cog.config.guild(context.guild).managers()
+                or not (await cog.get_managers(context.guild)).isdisjoint(
+                    context.author._roles
                 )
+                or await cog.is_mod_or_superior(context.author)
                 or False
             )
 
@@ -731,36 +1294,33 @@ class GrinderLogger(nu.Cog):
             return await context.send(
                 content="Limit your damn reason to 2k characters."
             )
-        tiers = await self.config.guild(context.guild).tiers()
+        tiers = await self.get_tier_table(context.guild.id)
 
-        if not tiers[tier]:
+        if int(tier) not in tiers:
             return await context.send(
                 content="You haven't set any amount and role for this tier yet."
             )
 
-        if guild := self.data.get(str(context.guild.id), {}):
-            if member_data := guild.get(str(member.id)):
-                if member_data["tier"] == tier:
+        if guild := self.data.get(context.guild.id, {}):
+            if record := guild.get(member.id):
+                if record.tier == int(tier):
                     return await context.send(
                         content="That grinder is already that tier."
                     )
-                if int(tier) < int(member_data["tier"]):
+                if int(tier) < record.tier:
                     return await context.send(
                         content="That tier is lower than this grinders tier did you mean to demote them"
                         f" instead?\n`{context.prefix}grinderlogger demote`"
                     )
-                before = member_data.get("tier")
-                member_data["tier"] = tier
-                after = member_data.get("tier")
-                await self.back_to_config()
+                before = str(record.tier)
+                record.tier = int(tier)
+                after = str(record.tier)
+                await self.save_guild(context.guild.id)
+                await self.update_leaderboard(context.guild, member.id)
                 audit_reason = mod.get_audit_reason(
                     context.author, reason=f"Member promoted to a Tier {tier} grinder."
                 )
-                roles = []
-                for tier_number in range(int(tier)):
-                    tn = str(tier_number + 1)
-                    if tiers[tn]:
-                        roles.append(tiers[tn]["role"])
+                roles = tiers.roles_between(1, int(tier))
                 added_roles = await self.add_or_remove_grinder_roles(
                     "add", member, roles, audit_reason
                 )
@@ -770,7 +1330,7 @@ class GrinderLogger(nu.Cog):
                     member,
                     before,
                     after,
-                    tiers[tier]["amount"],
+                    tiers.amount(int(tier)),
                     reason,
                 )
                 if await self.config.guild(context.guild).dm_status():
@@ -778,7 +1338,7 @@ class GrinderLogger(nu.Cog):
                         member,
                         "promote",
                         added_roles,
-                        tiers[tier]["amount"],
+                        tiers.amount(int(tier)),
                         before,
                         after,
                         reason,
@@ -812,36 +1372,33 @@ class GrinderLogger(nu.Cog):
             return await context.send(
                 content="Limit your damn reason to 2k characters."
             )
-        tiers = await self.config.guild(context.guild).tiers()
+        tiers = await self.get_tier_table(context.guild.id)
 
-        if not tiers[tier]:
+        if int(tier) not in tiers:
             return await context.send(
                 content="You haven't set any amount and role for this tier yet."
             )
 
-        if guild := self.data.get(str(context.guild.id), {}):
-            if member_data := guild.get(str(member.id)):
-                if member_data["tier"] == tier:
+        if guild := self.data.get(context.guild.id, {}):
+            if record := guild.get(member.id):
+                if record.tier == int(tier):
                     return await context.send(
                         content="That grinder is already that tier."
                     )
-                if int(tier) > int(member_data["tier"]):
+                if int(tier) > record.tier:
                     return await context.send(
                         content="That tier is higher than this grinders tier did you mean to promote them"
                         f" instead?\n`{context.prefix}grinderlogger promote`"
                     )
-                before = member_data.get("tier")
-                member_data["tier"] = tier
-                after = member_data.get("tier")
-                await self.back_to_config()
+                before = str(record.tier)
+                record.tier = int(tier)
+                after = str(record.tier)
+                await self.save_guild(context.guild.id)
+                await self.update_leaderboard(context.guild, member.id)
                 audit_reason = mod.get_audit_reason(
                     context.author, reason=f"Member demoted to a Tier {tier} grinder."
                 )
-                roles = []
-                for tier_number in range(int(tier)):
-                    tn = str(tier_number + 1)
-                    if tiers[tn]:
-                        roles.append(tiers[tn]["role"])
+                roles = tiers.roles_between(1, int(tier))
                 removed_roles = await self.add_or_remove_grinder_roles(
                     "remove", member, roles, audit_reason
                 )
@@ -851,7 +1408,7 @@ class GrinderLogger(nu.Cog):
                     member,
                     before,
                     after,
-                    tiers[tier]["amount"],
+                    tiers.amount(int(tier)),
                     reason,
                 )
                 if await self.config.guild(context.guild).dm_status():
@@ -859,7 +1416,7 @@ class GrinderLogger(nu.Cog):
                         member,
                         "demote",
                         removed_roles,
-                        tiers[tier]["amount"],
+                        tiers.amount(int(tier)),
                         before,
                         after,
                         reason,
@@ -885,17 +1442,16 @@ class GrinderLogger(nu.Cog):
 
         donations = await self.config.member(member).donations()
         times = await self.config.member(member).times_as_grinder()
-        tiers = await self.config.guild(context.guild).tiers()
+        tiers = await self.get_tier_table(context.guild.id)
 
-        guild_data = self.data.get(str(context.guild.id), {})
-        if member_data := guild_data.get(str(member.id)):
+        if record := self.get_grinder(context.guild.id, member.id):
             tier, due_stamp, grinder_since, last_pay = (
-                member_data.get("tier"),
-                member_data.get("due_timestamp"),
-                member_data.get("grinder_since"),
-                member_data.get("last_payed"),
+                str(record.tier),
+                record.due_timestamp,
+                record.grinder_since,
+                record.last_payed,
             )
-            amount = tiers[tier]["amount"]
+            amount = tiers.amount(record.tier)
             description = (
                 f"`{'Tier':<13}`: {tier} ({cf.humanize_number(amount)}/day)\n`{'Donations':<13}`: "
                 f"{cf.humanize_number(donations)}\n`{'Times Joined':<13}`: "
@@ -969,6 +1525,127 @@ class GrinderLogger(nu.Cog):
         else:
             await self.donoremove(context, member, amount, time, note)
 
+    @grinderlogger.command(name="bulkdono", aliases=["bulk"])
+    @is_a_grinder_manager()
+    async def grinderlogger_bulkdono(
+        self, context: commands.Context, *, payments: str = None
+    ):
+        """
+        Add many grinder donations at once.
+
+        Pass a multi-line list or attach a CSV file, one payment per line.
+        Each line is `member, amount[, time]`, the same values `[p]grlog dono add` accepts.
+        All payments are applied together and summarised in one log message.
+
+        Example:
+        `[p]grlog bulkdono`
+        `@member, 10m, 5d`
+        `user_id, 20m`
+        """
+        if attachments := context.message.attachments:
+            if attachments[0].size > BULK_FILE_SIZE_LIMIT:
+                return await context.send(
+                    content=f"The file can be at most {BULK_FILE_SIZE_LIMIT // 1024} KiB."
+                )
+            raw = (await attachments[0].read()).decode("utf-8-sig", errors="ignore")
+        else:
+            raw = payments
+        if not raw:
+            return await context.send_help()
+        if not self.data.get(context.guild.id, {}):
+            return await context.send(content="This guild has no grinders.")
+
+        rows = self.read_bulk_rows(raw)
+        if len(rows) > BULK_PAYMENT_LIMIT:
+            return await context.send(
+                content=f"You can only log up to {BULK_PAYMENT_LIMIT} payments at once."
+            )
+        parsed, failed = await self.parse_bulk_payments(context, rows)
+        if failed:
+            pagified = await nu.pagify_this(
+                "\n".join(failed),
+                "\n",
+                embed_title="Skipped Payments",
+                embed_colour=await context.embed_colour(),
+            )
+            await nu.NoobPaginator(pagified).start(context)
+        if not parsed:
+            return await context.send(content="No valid payments were found.")
+
+        results = await self.bulk_donoadd(context, parsed)
+        await context.send(
+            content=f"Logged {cf.humanize_number(len(results))} grinder payments totalling "
+            f"{cf.humanize_number(sum(a - b for _, b, a, _ in results))}."
+        )
+
+    @grinderlogger.command(name="report")
+    @is_a_grinder_manager()
+    async def grinderlogger_report(self, context: commands.Context):
+        """
+        See who is behind on payments and the expected grinder intake per tier.
+
+        Arrears count the days past a grinder's due date, or since they joined if they never paid.
+        The projected intake only counts grinders that are up to date.
+        """
+        guild_data = self.data.get(context.guild.id, {})
+        if not guild_data:
+            return await context.send(content="This guild has no grinders.")
+
+        tiers = await self.get_tier_table(context.guild.id)
+        leaderboard = await self.get_leaderboard(context.guild)
+        now = round(dt.datetime.now(dt.timezone.utc).timestamp())
+        per_tier, arrears = compute_grinder_report(
+            now,
+            (
+                (
+                    mid,
+                    record.tier,
+                    tiers.amount(record.tier),
+                    record.grinder_since,
+                    entry["due"] or 0,
+                    entry["donations"],
+                )
+                for mid, entry in leaderboard.sorted("tier")
+                if (record := guild_data.get(mid))
+            ),
+        )
+
+        summary = []
+        for tier in sorted(per_tier, reverse=True):
+            totals = per_tier[tier]
+            summary.append(
+                f"**Tier {tier}** ({cf.humanize_number(totals['grinders'])} grinders, "
+                f"{cf.humanize_number(totals['behind'])} behind)\n"
+                f"> - `{'Expected':<9}`: {cf.humanize_number(totals['expected'])}\n"
+                f"> - `{'Received':<9}`: {cf.humanize_number(totals['received'])}\n"
+                f"> - `{'Arrears':<9}`: {cf.humanize_number(totals['arrears'])}\n"
+                f"> - `{'Projected':<9}`: {cf.humanize_number(totals['projected'])}/day "
+                f"({cf.humanize_number(totals['daily'])}/day if everyone pays)"
+            )
+        daily = sum(totals["projected"] for totals in per_tier.values())
+        summary.append(
+            f"**Projected intake:** {cf.humanize_number(daily)}/day, "
+            f"{cf.humanize_number(daily * 7)}/week, {cf.humanize_number(daily * 30)}/month"
+        )
+
+        behind = sorted(((a, mid) for mid, a in arrears.items()), reverse=True)
+        if behind:
+            summary.append("**Grinders behind on payments:**")
+            summary.extend(
+                f"` {index}. ` <@{mid}> (`{mid}`): {cf.humanize_number(a)}"
+                for index, (a, mid) in enumerate(behind, 1)
+            )
+
+        pagified = await nu.pagify_this(
+            "\n\n".join(summary[: len(per_tier) + 1])
+            + ("\n\n" + "\n".join(summary[len(per_tier) + 1 :]) if behind else ""),
+            "\n",
+            embed_title=f"GrinderLogger Report for [{context.guild.name}]",
+            embed_timestamp=dt.datetime.now(dt.timezone.utc),
+            embed_colour=await context.embed_colour(),
+        )
+        await nu.NoobPaginator(pagified).start(context)
+
     @grinderlogger.command(name="leaderboard", aliases=["lb"])
     @commands.bot_has_permissions(embed_links=True)
     async def grinderlogger_leaderboard(
@@ -979,23 +1656,11 @@ class GrinderLogger(nu.Cog):
         """
         Show the grinderlogger leaderboard.
         """
-        all_members = self.data.get(str(context.guild.id), {})
-        if not all_members:
+        if not self.data.get(context.guild.id, {}):
             return await context.send(content="This guild has no grinders.")
 
-        all_m = {}
-        for mid, md in all_members.copy().items():
-            member = context.guild.get_member(int(mid))
-            donations = await self.config.member_from_ids(
-                context.guild.id, int(mid)
-            ).donations()
-            all_m[member or mid] = {
-                "donations": donations,
-                "due": md["due_timestamp"],
-                "tier": md["tier"],
-            }
-
-        all_mem = await self.lb_whatever(context.guild, sort_by, all_m)
+        leaderboard = await self.get_leaderboard(context.guild)
+        all_mem = await self.lb_whatever(context.guild, leaderboard.sorted(sort_by))
 
         pagified = await nu.pagify_this(
             "\n\n".join(all_mem),
@@ -1006,6 +1671,78 @@ class GrinderLogger(nu.Cog):
         )
         await nu.NoobPaginator(pagified).start(context)
 
+    @grinderlogger.group(name="history")
+    @is_a_grinder_manager()
+    async def grinderlogger_history(self, context: commands.Context):
+        """
+        Look up logged grinder payments.
+
+        Dates use the `YYYY-MM-DD` format (UTC).
+        Without dates the last 30 days are shown, a range can span at most 366 days.
+        """
+        pass
+
+    @grinderlogger_history.command(name="member")
+    async def grinderlogger_history_member(
+        self,
+        context: commands.Context,
+        member: Union[discord.Member, discord.User],
+        since: DateConverter = None,
+        until: DateConverter = None,
+    ):
+        """
+        See the payments of a grinder.
+
+        Example:
+        `[p]grlog history member @member 2024-01-01 2024-01-31`
+        """
+        await self.send_ledger_history(
+            context,
+            f"Grinder payments of {member.name} ({member.id})",
+            since,
+            until,
+            member_id=member.id,
+        )
+
+    @grinderlogger_history.command(name="range")
+    async def grinderlogger_history_range(
+        self,
+        context: commands.Context,
+        since: DateConverter = None,
+        until: DateConverter = None,
+    ):
+        """
+        See every grinder payment in a date range.
+
+        Example:
+        `[p]grlog history range 2024-01-01 2024-01-31`
+        """
+        await self.send_ledger_history(
+            context, f"Grinder payments for [{context.guild.name}]", since, until
+        )
+
+    @grinderlogger_history.command(name="tier")
+    async def grinderlogger_history_tier(
+        self,
+        context: commands.Context,
+        tier: Literal["1", "2", "3", "4", "5"],
+        since: DateConverter = None,
+        until: DateConverter = None,
+    ):
+        """
+        See the payments made by grinders of a tier.
+
+        Example:
+        `[p]grlog history tier 3 2024-01-01`
+        """
+        await self.send_ledger_history(
+            context,
+            f"Tier {tier} grinder payments for [{context.guild.name}]",
+            since,
+            until,
+            tier=int(tier),
+        )
+
     @grinderlogger.command(name="addmember")
     @is_a_grinder_manager()
     @commands.bot_has_permissions(manage_roles=True)
@@ -1027,40 +1764,36 @@ class GrinderLogger(nu.Cog):
                 content="Limit your damn reason to 2k characters."
             )
 
-        tiers = await self.config.guild(context.guild).tiers()
+        tiers = await self.get_tier_table(context.guild.id)
 
-        if not tiers[tier]:
+        if int(tier) not in tiers:
             return await context.send(
                 content="You haven't set any amount and role for this tier yet."
             )
         if member.bot:
             return await context.send(content="Bots are not allowed.")
 
-        if self.data.get(str(context.guild.id), {}).get(str(member.id)):
+        if self.get_grinder(context.guild.id, member.id):
             return await context.send(content="This member is already a grinder.")
 
-        member_data = {
-            "tier": tier,
-            "due_timestamp": None,
-            "grinder_since": round(dt.datetime.now(dt.timezone.utc).timestamp()),
-            "last_payed": None,
-            "reminded": True,
-        }
+        record = GrinderRecord(
+            guild_id=context.guild.id,
+            member_id=member.id,
+            tier=int(tier),
+            grinder_since=round(dt.datetime.now(dt.timezone.utc).timestamp()),
+        )
 
         times = await self.config.member(member).times_as_grinder()
         await self.config.member(member).times_as_grinder.set(times + 1)
-        self.add_to_data(str(context.guild.id), str(member.id), member_data)
+        self.add_to_data(record)
 
-        await self.back_to_config()
+        await self.save_guild(context.guild.id)
+        await self.update_leaderboard(context.guild, member.id)
 
         audit_reason = mod.get_audit_reason(
             context.author, reason=f"Member is a Tier {tier} grinder."
         )
-        roles = []
-        for tier_number in range(int(tier)):
-            tn = str(tier_number + 1)
-            if tiers[tn]:
-                roles.append(tiers[tn]["role"])
+        roles = tiers.roles_between(1, int(tier))
         added_roles = await self.add_or_remove_grinder_roles(
             "add", member, roles, audit_reason
         )
@@ -1068,14 +1801,14 @@ class GrinderLogger(nu.Cog):
         await self.dm_grinder(
             context.guild,
             member,
-            tiers[tier]["amount"],
+            tiers.amount(int(tier)),
             added_roles,
             tier,
             "added",
             reason,
         )
         await self.log_grinder_history(
-            context, member, tier, tiers[tier]["amount"], "added", None, reason
+            context, member, tier, tiers.amount(int(tier)), "added", None, reason
         )
 
     @grinderlogger.command(name="removemember")
@@ -1099,21 +1832,21 @@ class GrinderLogger(nu.Cog):
             return await context.send(
                 content="Limit your damn reason to 2k characters."
             )
-        tiers = await self.config.guild(context.guild).tiers()
-        if member_data := self.data.get(str(context.guild.id), {}).get(str(member.id)):
-            tier = member_data["tier"]
+        tiers = await self.get_tier_table(context.guild.id)
+        if record := self.get_grinder(context.guild.id, member.id):
+            tier = str(record.tier)
             await self.log_grinder_history(
                 context,
                 member,
                 tier,
-                tiers[tier]["amount"],
+                tiers.amount(int(tier)),
                 "removed",
-                dt.datetime.now(dt.timezone.utc).timestamp()
-                - member_data["grinder_since"],
+                dt.datetime.now(dt.timezone.utc).timestamp() - record.grinder_since,
                 reason,
             )
-            self.remove_from_data(str(context.guild.id), str(member.id))
-            await self.back_to_config()
+            self.remove_from_data(context.guild.id, member.id)
+            await self.save_guild(context.guild.id)
+            await self.update_leaderboard(context.guild, member.id)
             await self.config.member_from_ids(
                 context.guild.id, member.id
             ).last_time_as_grinder.set(
@@ -1122,18 +1855,14 @@ class GrinderLogger(nu.Cog):
             audit_reason = mod.get_audit_reason(
                 context.author, reason=f"Member is no longer a Tier {tier} grinder."
             )
-            roles = []
-            for tier_number in range(int(tier)):
-                tn = str(tier_number + 1)
-                if tiers[tn]:
-                    roles.append(tiers[tn]["role"])
+            roles = tiers.roles_between(1, int(tier))
             removed_roles = await self.add_or_remove_grinder_roles(
                 "remove", member, roles, audit_reason
             )
             await self.dm_grinder(
                 context.guild,
                 member,
-                tiers[tier]["amount"],
+                tiers.amount(int(tier)),
                 removed_roles,
                 tier,
                 "removed",
@@ -1242,6 +1971,8 @@ class GrinderLogger(nu.Cog):
                 else:
                     managers.remove(role.id)
                 success.append(role)
+        self.manager_cache.pop(context.guild.id, None)
+        self.non_manager_cache.pop(context.guild.id, None)
 
         _type = "was added to" if add_or_remove_or_list == "add" else "was removed from"
         _type2 = "add to" if add_or_remove_or_list == "add" else "remove from"
@@ -1304,6 +2035,37 @@ class GrinderLogger(nu.Cog):
                 )
             )
 
+    @grinderloggerset.command(name="escalation", aliases=["escalate"])
+    async def grinderloggerset_escalation(
+        self,
+        context: commands.Context,
+        setting: Literal["grace", "reminder", "demote", "remove"],
+        days: commands.Range[int, 0, 365],
+    ):
+        """
+        Configure what happens to grinders that are overdue on payments.
+
+        `grace` - Days after the due date before reminders, demotions and removals start.
+        `reminder` - Days between repeated reminders after the first one.
+        `demote` - Demote the grinder one tier for every this many overdue days.
+        `remove` - Remove the grinder once they are this many days overdue.
+        Set any of them to 0 to disable it.
+
+        Examples:
+        `[p]grlogset escalation grace 1`
+        `[p]grlogset escalation demote 3`: Demote one tier every 3 overdue days.
+        `[p]grlogset escalation remove 14`
+        """
+        await self.config.guild(context.guild).escalation.set_raw(setting, value=days)
+        self.escalation_cache.pop(context.guild.id, None)
+        await context.send(
+            content=(
+                f"The escalation `{setting}` setting has been set to {days} days."
+                if days
+                else f"The escalation `{setting}` setting has been disabled."
+            )
+        )
+
     @grinderloggerset.command(name="tier", aliases=["t"])
     async def grinderloggerset_tier(
         self,
@@ -1335,6 +2097,7 @@ class GrinderLogger(nu.Cog):
                         content="That tier already has an amount roles setup."
                     )
                 tiers[tier] = {"amount": amount, "role": role.id}
+            self.tier_cache.pop(context.guild.id, None)
             await context.send(
                 content=f"Set Tier {tier} with the role {role.mention} and {cf.humanize_number(amount)}/day."
             )
@@ -1345,6 +2108,7 @@ class GrinderLogger(nu.Cog):
                         content="That tier does not have any amount roles setup."
                     )
                 tiers[tier] = {}
+            self.tier_cache.pop(context.guild.id, None)
             await context.send(content="That tier has been cleared.")
 
     @grinderloggerset.command(name="resetguild")
@@ -1358,12 +2122,17 @@ class GrinderLogger(nu.Cog):
         await view.start(context, act, content=conf)
         await view.wait()
         if view.value:
-            with contextlib.suppress(KeyError):
-                self.data.pop(str(context.guild.id))
-            old_data = (await self.config.custom("Grinders").all()).copy()
-            with contextlib.suppress(KeyError):
-                old_data.pop(str(context.guild.id))
-            await self.config.custom("Grinders").set(old_data)
+            for member_id in self.data.pop(context.guild.id, {}).copy():
+                self.remove_from_data(context.guild.id, member_id)
+            self.leaderboard_cache.pop(context.guild.id, None)
+            self.manager_cache.pop(context.guild.id, None)
+            self.non_manager_cache.pop(context.guild.id, None)
+            self.escalation_cache.pop(context.guild.id, None)
+            self.tier_cache.pop(context.guild.id, None)
+            for key in [k for k in self.ledger_cache if k[0] == context.guild.id]:
+                self.ledger_cache.pop(key)
+            await self.config.custom("GrinderLedger", str(context.guild.id)).clear()
+            await self.config.custom("Grinders", str(context.guild.id)).clear()
             await self.config.guild(context.guild).clear()
             await self.config.clear_all_members(context.guild)
 
@@ -1383,9 +2152,18 @@ class GrinderLogger(nu.Cog):
             self.save_data_to_config.restart()
             self.due_reminder_loop.restart()
             self.data.clear()
+            self.member_guilds.clear()
+            self.leaderboard_cache.clear()
+            self.manager_cache.clear()
+            self.non_manager_cache.clear()
+            self.escalation_cache.clear()
+            self.tier_cache.clear()
+            self.ledger_cache.clear()
             await self.back_to_config()
             await self.config.clear_all_guilds()
             await self.config.clear_all_custom("Grinders")
+            await self.config.clear_all_custom("GrinderLedger")
+            self.ledger_indexed.clear()
             await self.config.clear_all_members()
             await self.config.clear_all()
             self.init_done = True
@@ -1400,6 +2178,7 @@ class GrinderLogger(nu.Cog):
         tiers = await self.config.guild(context.guild).tiers()
         bank = await self.config.guild(context.guild).bank()
         dm_status = await self.config.guild(context.guild).dm_status()
+        escalation = await self.config.guild(context.guild).escalation()
         logchan = f'<#{channels["logging"]}>' if channels["logging"] else "**None**"
         notifychan = (
             f'<#{channels["notifying"]}>' if channels["notifying"] else "**None**"
@@ -1436,4 +2215,12 @@ class GrinderLogger(nu.Cog):
             inline=False,
         )
         embed.add_field(name="Tiers:", value="\n".join(desc), inline=False)
+        embed.add_field(
+            name="Escalation:",
+            value="\n".join(
+                f"` - ` {k.title()}: {f'{v} days' if v else '**Disabled**'}"
+                for k, v in escalation.items()
+            ),
+            inline=False,
+        )
         await context.send(embed=embed)
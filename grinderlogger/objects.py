@@ -0,0 +1,79 @@
+from typing import Any, Dict, Optional, Self
+
+
+class GrinderRecord:
+    __slots__ = (
+        "guild_id",
+        "member_id",
+        "tier",
+        "due_timestamp",
+        "reminded",
+        "grinder_since",
+        "last_payed",
+        "reminders",
+        "last_reminded",
+        "demotions",
+    )
+
+    def __init__(
+        self,
+        guild_id: int,
+        member_id: int,
+        tier: int,
+        grinder_since: int,
+        due_timestamp: Optional[int] = None,
+        reminded: bool = True,
+        last_payed: Optional[int] = None,
+        reminders: int = 0,
+        last_reminded: Optional[int] = None,
+        demotions: int = 0,
+    ) -> None:
+        self.guild_id: int = guild_id
+        self.member_id: int = member_id
+        self.tier: int = tier
+        self.grinder_since: int = grinder_since
+        self.due_timestamp: Optional[int] = due_timestamp
+        self.reminded: bool = reminded
+        self.last_payed: Optional[int] = last_payed
+        self.reminders: int = reminders
+        self.last_reminded: Optional[int] = last_reminded
+        self.demotions: int = demotions
+
+    def __repr__(self) -> str:
+        return (
+            f"<GrinderRecord guild_id={self.guild_id} member_id={self.member_id} "
+            f"tier={self.tier} due_timestamp={self.due_timestamp} reminded={self.reminded}>"
+        )
+
+    @classmethod
+    def from_dict(cls, guild_id: int, member_id: int, data: Dict[str, Any]) -> Self:
+        return cls(
+            guild_id=guild_id,
+            member_id=member_id,
+            tier=int(data["tier"]),
+            grinder_since=data["grinder_since"],
+            due_timestamp=data.get("due_timestamp"),
+            reminded=data.get("reminded", True),
+            last_payed=data.get("last_payed"),
+            reminders=data.get("reminders", 0),
+            last_reminded=data.get("last_reminded"),
+            demotions=data.get("demotions", 0),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tier": str(self.tier),
+            "due_timestamp": self.due_timestamp,
+            "grinder_since": self.grinder_since,
+            "last_payed": self.last_payed,
+            "reminded": self.reminded,
+            "reminders": self.reminders,
+            "last_reminded": self.last_reminded,
+            "demotions": self.demotions,
+        }
+
+    def reset_escalation(self) -> None:
+        self.reminded = False
+        self.reminders = 0
+        self.last_reminded = None
+        self.demotions = 0
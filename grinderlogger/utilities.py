@@ -0,0 +1,163 @@
+import bisect
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class GrinderLeaderboard:
+    SORT_KEYS = ("dono", "due", "tier")
+
+    def __init__(self):
+        self.entries: Dict[int, Dict[str, Optional[int]]] = {}
+        self._views: Dict[str, List[Tuple[int, int]]] = {k: [] for k in self.SORT_KEYS}
+
+    @staticmethod
+    def _key(sort_by: str, entry: Dict[str, Optional[int]]) -> int:
+        if sort_by == "dono":
+            return entry["donations"]
+        elif sort_by == "due":
+            return entry["due"] or 0
+        return int(entry["tier"])
+
+    def upsert(
+        self, member_id: int, donations: int, due: Optional[int], tier: int
+    ) -> None:
+        self.remove(member_id)
+        entry = {"donations": donations, "due": due, "tier": tier}
+        self.entries[member_id] = entry
+        for sort_by, view in self._views.items():
+            # Negated keys keep every view ascending so bisect can be used directly.
+            bisect.insort(view, (-self._key(sort_by, entry), member_id))
+
+    def remove(self, member_id: int) -> None:
+        entry = self.entries.pop(member_id, None)
+        if entry is None:
+            return
+        for sort_by, view in self._views.items():
+            item = (-self._key(sort_by, entry), member_id)
+            index = bisect.bisect_left(view, item)
+            if index < len(view) and view[index] == item:
+                view.pop(index)
+
+    def sorted(self, sort_by: str) -> List[Tuple[int, Dict[str, Optional[int]]]]:
+        return [(mid, self.entries[mid]) for _, mid in self._views[sort_by]]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class GrinderTierTable:
+    """
+    A guild's tier settings as tier-indexed arrays.
+
+    Index 0 is unused so tier numbers can be used directly, undefined tiers hold 0.
+    """
+
+    __slots__ = ("amounts", "roles")
+
+    def __init__(self, tiers: Dict[str, Dict[str, int]]):
+        self.amounts = array("q", [0] * (len(tiers) + 1))
+        self.roles = array("Q", [0] * (len(tiers) + 1))
+        for tier, data in tiers.items():
+            if data:
+                self.amounts[int(tier)] = data["amount"]
+                self.roles[int(tier)] = data["role"]
+
+    def __contains__(self, tier: int) -> bool:
+        return 0 < tier < len(self.roles) and bool(self.roles[tier])
+
+    def amount(self, tier: int) -> int:
+        return self.amounts[tier] if 0 < tier < len(self.amounts) else 0
+
+    def roles_between(self, lowest: int, highest: int) -> List[int]:
+        return [r for r in self.roles[max(lowest, 1) : highest + 1] if r]
+
+    def next_lower(self, tier: int) -> Optional[int]:
+        return next((t for t in range(tier - 1, 0, -1) if self.roles[t]), None)
+
+
+class LedgerPartition:
+    """
+    One day of grinder payments, indexed by member and tier.
+
+    Records are compact `[timestamp, member_id, amount, tier, author_id]` lists kept
+    in the order they were appended, which is also timestamp order.
+    """
+
+    def __init__(self, records: List[List[int]] = None):
+        self.records: List[List[int]] = []
+        self.timestamps: List[int] = []
+        self.by_member: Dict[int, List[int]] = {}
+        self.by_tier: Dict[int, List[int]] = {}
+        for record in records or []:
+            self.append(record)
+
+    def append(self, record: List[int]) -> None:
+        position = len(self.records)
+        self.records.append(record)
+        self.timestamps.append(record[0])
+        self.by_member.setdefault(record[1], []).append(position)
+        self.by_tier.setdefault(record[3], []).append(position)
+
+    def query(
+        self,
+        since: int,
+        until: int,
+        member_id: Optional[int] = None,
+        tier: Optional[int] = None,
+    ) -> List[List[int]]:
+        lo = bisect.bisect_left(self.timestamps, since)
+        hi = bisect.bisect_right(self.timestamps, until)
+        if member_id is not None:
+            positions = self.by_member.get(member_id, [])
+        elif tier is not None:
+            positions = self.by_tier.get(tier, [])
+        else:
+            return self.records[lo:hi]
+        start = bisect.bisect_left(positions, lo)
+        end = bisect.bisect_left(positions, hi)
+        return [
+            record
+            for record in (self.records[p] for p in positions[start:end])
+            if tier is None or record[3] == tier
+        ]
+
+
+def compute_grinder_report(
+    now: int, grinders: Iterable[Tuple[int, int, int, int, int, int]]
+) -> Tuple[Dict[int, Dict[str, int]], Dict[int, int]]:
+    """
+    Compute per-tier totals and per-grinder arrears in one pass.
+
+    Each grinder is a `(member_id, tier, amount, since, due, donations)` tuple, `due`
+    is 0 for grinders that have never paid. Returns the per-tier totals and the
+    arrears of every grinder that is behind.
+    """
+    per_tier: Dict[int, Dict[str, int]] = {}
+    arrears: Dict[int, int] = {}
+    for member_id, tier, amount, since, due, donations in grinders:
+        totals = per_tier.setdefault(
+            tier,
+            {
+                "grinders": 0,
+                "behind": 0,
+                "daily": 0,
+                "projected": 0,
+                "expected": 0,
+                "received": 0,
+                "arrears": 0,
+            },
+        )
+        overdue = now - (due or since)
+        totals["grinders"] += 1
+        totals["daily"] += amount
+        totals["expected"] += max(now - since, 0) * amount // 86400
+        totals["received"] += donations
+        if overdue > 0:
+            if owed := overdue * amount // 86400:
+                arrears[member_id] = owed
+                totals["arrears"] += owed
+            totals["behind"] += 1
+        else:
+            totals["projected"] += amount
+    return per_tier, arrears
@@ -0,0 +1,97 @@
+import asyncio
+import importlib.util
+import pathlib
+import random
+
+# The cog package imports Red on import, the lock module itself is plain asyncio.
+_spec = importlib.util.spec_from_file_location(
+    "donationlogger_locks",
+    pathlib.Path(__file__).parents[1] / "donationlogger" / "locks.py",
+)
+locks = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(locks)
+
+GUILD_ID = 1
+BANK = "dank"
+MEMBERS = range(100)
+SINGLE_ADDS = 5000
+BULK_WRITES = 50
+BULK_AMOUNT = 10
+
+
+class FakeBank:
+    """
+    A bank whose writes yield between reading and writing, like config does.
+    """
+
+    def __init__(self):
+        self.donors = {member_id: 0 for member_id in MEMBERS}
+        self.single_holders = 0
+        self.bulk_holders = 0
+        self.overlaps = 0
+
+    async def single_add(self, key_locks, member_id: int):
+        async with key_locks.hold(
+            (GUILD_ID, BANK, member_id), shared=[(GUILD_ID, BANK)]
+        ):
+            self.single_holders += 1
+            self.overlaps += bool(self.bulk_holders)
+            previous = self.donors[member_id]
+            await asyncio.sleep(0)
+            self.donors[member_id] = previous + 1
+            self.single_holders -= 1
+
+    async def bulk_write(self, key_locks):
+        async with key_locks.hold((GUILD_ID, BANK)):
+            self.bulk_holders += 1
+            self.overlaps += bool(self.single_holders) or self.bulk_holders > 1
+            donors = dict(self.donors)
+            await asyncio.sleep(0)
+            self.donors = {k: v + BULK_AMOUNT for k, v in donors.items()}
+            self.bulk_holders -= 1
+
+
+def test_single_adds_and_bulk_writes_serialise():
+    async def run():
+        key_locks = locks.KeyedLocks()
+        bank = FakeBank()
+        jobs = [
+            bank.single_add(key_locks, i % len(MEMBERS)) for i in range(SINGLE_ADDS)
+        ]
+        jobs += [bank.bulk_write(key_locks) for _ in range(BULK_WRITES)]
+        random.Random(0).shuffle(jobs)
+        await asyncio.gather(*jobs)
+        return key_locks, bank
+
+    key_locks, bank = asyncio.run(run())
+    expected = SINGLE_ADDS // len(MEMBERS) + BULK_WRITES * BULK_AMOUNT
+    assert bank.donors == {member_id: expected for member_id in MEMBERS}
+    assert bank.overlaps == 0
+    assert len(key_locks) == 0
+
+
+def test_member_locks_of_a_batch_exclude_single_adds():
+    async def batch(key_locks, bank: FakeBank, member_ids):
+        async with key_locks.hold(
+            *[(GUILD_ID, BANK, m) for m in member_ids], shared=[(GUILD_ID, BANK)]
+        ):
+            previous = {m: bank.donors[m] for m in member_ids}
+            await asyncio.sleep(0)
+            for m in member_ids:
+                bank.donors[m] = previous[m] + 1
+
+    async def run():
+        key_locks = locks.KeyedLocks()
+        bank = FakeBank()
+        rng = random.Random(1)
+        jobs = [bank.single_add(key_locks, m) for m in MEMBERS for _ in range(10)]
+        jobs += [
+            batch(key_locks, bank, rng.sample(list(MEMBERS), 5)) for _ in range(200)
+        ]
+        rng.shuffle(jobs)
+        await asyncio.gather(*jobs)
+        return key_locks, bank
+
+    key_locks, bank = asyncio.run(run())
+    assert sum(bank.donors.values()) == len(MEMBERS) * 10 + 200 * 5
+    assert len(key_locks) == 0